@@ -0,0 +1,86 @@
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from retail_ims import Catalog, Order, Product
+
+# Contention benchmark for the optimistic (versioned compare-and-set) stock updates.
+# N worker threads all place orders against the same few hot products. We measure orders per
+# second and how often a commit lost the race and had to retry, and check nothing was oversold.
+# "global-lock" runs the same workload with every order behind one lock, for comparison.
+# A short thread switch interval makes the threads interleave far more often than usual,
+# which is what provokes the conflicts.
+
+
+def _worker(orders, global_lock):
+    for order in orders:
+        if global_lock is None:
+            order.place()
+        else:
+            with global_lock:
+                order.place()
+
+
+def run_contention(workers=8, orders_per_worker=5_000, hot_products=4, stock=100_000, mode="optimistic", seed=0):
+    previous = Product.inventory
+    Product.inventory = catalog = Catalog()
+    try:
+        for i in range(hot_products):
+            Product.add_product(f"Hot product {i}", "Flash sale", stock, 10, "Supplier A")
+        product_ids = [product.product_id for product in catalog]
+
+        rng = random.Random(seed)
+        batches = [
+            [
+                Order(w * orders_per_worker + i, [(rng.choice(product_ids), rng.randint(1, 3)) for _ in range(2)])
+                for i in range(orders_per_worker)
+            ]
+            for w in range(workers)
+        ]
+        global_lock = threading.Lock() if mode == "global-lock" else None
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            for future in [pool.submit(_worker, batch, global_lock) for batch in batches]:
+                future.result()
+        elapsed = time.perf_counter() - start
+
+        orders = [order for batch in batches for order in batch]
+        placed = [order for order in orders if order.status == "placed"]
+        sold = sum(quantity for order in placed for _, quantity in order.products)
+        remaining = sum(product.quantity for product in catalog)
+        attempts = len(orders) + catalog.conflicts
+        return {
+            "mode": mode,
+            "orders": len(orders),
+            "placed": len(placed),
+            "seconds": elapsed,
+            "per_second": len(orders) / elapsed,
+            "conflicts": catalog.conflicts,
+            "conflict_rate": catalog.conflicts / attempts,
+            # Every unit sold must have come out of stock, and no stock may go negative
+            "oversold": sold != hot_products * stock - remaining or any(p.quantity < 0 for p in catalog),
+        }
+    finally:
+        Product.inventory = previous
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hammer a few hot products from many threads")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--orders", type=int, default=5_000, help="orders per worker")
+    parser.add_argument("--hot", type=int, default=4, help="number of hot products")
+    parser.add_argument("--stock", type=int, default=100_000, help="starting stock per product")
+    parser.add_argument("--switch-interval", type=float, default=1e-6, help="seconds, see sys.setswitchinterval")
+    args = parser.parse_args()
+
+    sys.setswitchinterval(args.switch_interval)
+    for mode in ("optimistic", "global-lock"):
+        result = run_contention(args.workers, args.orders, args.hot, args.stock, mode)
+        print(
+            f"{mode:>11}: {result['per_second']:>9,.0f} orders/s, {result['placed']:,}/{result['orders']:,} placed, "
+            f"{result['conflicts']:,} conflicts ({result['conflict_rate']:.1%}), oversold: {result['oversold']}"
+        )
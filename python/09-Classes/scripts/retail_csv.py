@@ -0,0 +1,202 @@
+import csv
+import os
+import time
+from itertools import islice
+
+from retail_ims import Product
+
+# Streaming CSV import and export for the catalog.
+# Rows are read one at a time, converted to plain tuples and handed to Catalog.bulk_upsert in
+# batches, so a nightly reload never holds the whole file in memory and skips the per-row
+# overhead of Product.add_product (constructor, id counter, remove-then-add).
+#
+# The looker_ecommerce dbt seeds make a realistic fixture: products.csv has the catalog, and
+# inventory_items.csv has one row per physical item, so the items not sold yet are the stock.
+
+SEEDS_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "dbt", "Projects", "looker_ecommerce", "seeds"
+)
+
+FIELDS = ("product_id", "name", "category", "quantity", "price", "supplier")
+
+# Which CSV column holds each product field. Fields missing from the mapping are filled in later
+# (quantity comes from the stock counts, or 0).
+EXPORT_COLUMNS = {field: field for field in FIELDS}
+SEED_COLUMNS = {
+    "product_id": "id",
+    "name": "name",
+    "category": "category",
+    "price": "retail_price",
+    "supplier": "brand",
+}
+
+BUFFER_SIZE = 1 << 20  # 1 MiB read/write buffers
+
+
+class ImportReport:
+    def __init__(self, rows, imported, duplicates, errors, seconds):
+        self.rows = rows
+        self.imported = imported
+        self.duplicates = duplicates
+        self.errors = errors  # A list of (line_number, reason) tuples
+        self.seconds = seconds
+
+    @property
+    def per_second(self):
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self):
+        return (
+            f"{self.rows:,} rows read, {self.imported:,} products imported, {self.duplicates:,} duplicate ids, "
+            f"{len(self.errors):,} bad rows in {self.seconds:.3f}s ({self.per_second:,.0f} rows/s)"
+        )
+
+
+def read_rows(path):
+    # Yields the header, then (line_number, row list) pairs. Plain csv.reader lists are much
+    # cheaper than a dict per row; columns are looked up by position once the header is known.
+    with open(path, newline="", encoding="utf-8", buffering=BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        yield next(reader, [])
+        yield from enumerate(reader, start=2)
+
+
+def _positions(header, columns):
+    # Field name -> column index, for the fields present in `columns`
+    missing = [column for column in columns.values() if column not in header]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return {field: header.index(column) for field, column in columns.items()}
+
+
+def stock_from_inventory(path):
+    # Units in stock per product: inventory items that have not been sold yet
+    rows = read_rows(path)
+    positions = _positions(next(rows), {"product_id": "product_id", "sold_at": "sold_at"})
+    product_column, sold_column = positions["product_id"], positions["sold_at"]
+
+    stock = {}
+    for _, row in rows:
+        if not row[sold_column]:
+            product_id = int(row[product_column])
+            stock[product_id] = stock.get(product_id, 0) + 1
+    return stock
+
+
+def coerce(row, positions, stock=None):
+    # One CSV row -> a (product_id, name, category, quantity, price, supplier) tuple.
+    # Raises ValueError (or IndexError for a short row) if the row can't be used.
+    product_id = int(row[positions["product_id"]])
+    if "quantity" in positions:
+        quantity = int(row[positions["quantity"]])
+    else:
+        quantity = stock.get(product_id, 0) if stock is not None else 0
+    if quantity < 0:
+        raise ValueError(f"negative quantity {quantity}")
+    return (
+        product_id,
+        row[positions["name"]].strip(),
+        row[positions["category"]].strip(),
+        quantity,
+        float(row[positions["price"]]),
+        row[positions["supplier"]].strip(),
+    )
+
+
+def product_tuples(path, columns=EXPORT_COLUMNS, stock=None, errors=None, seen=None):
+    # Generator of coerced product tuples. Bad rows are skipped and noted in `errors`;
+    # ids already in `seen` are still yielded (the later row wins) but counted as duplicates there.
+    rows = read_rows(path)
+    positions = _positions(next(rows), columns)
+    for line_number, row in rows:
+        try:
+            product = coerce(row, positions, stock)
+        except (IndexError, ValueError) as error:
+            if errors is not None:
+                errors.append((line_number, f"{type(error).__name__}: {error}"))
+            continue
+        if seen is not None:
+            seen[product[0]] = seen.get(product[0], 0) + 1
+        yield product
+
+
+def import_products(path, catalog=None, columns=EXPORT_COLUMNS, stock=None, batch_size=10_000):
+    catalog = catalog if catalog is not None else Product.inventory
+    start = time.perf_counter()
+    errors = []
+    seen = {}  # product_id -> times it appeared in the file
+
+    products = product_tuples(path, columns, stock, errors, seen)
+    imported = 0
+    while batch := list(islice(products, batch_size)):
+        imported += catalog.bulk_upsert(batch)
+
+    rows = imported + len(errors)
+    duplicates = imported - len(seen)
+    return ImportReport(rows, len(seen), duplicates, errors, time.perf_counter() - start)
+
+
+def import_seeds(catalog=None, seeds_dir=SEEDS_DIR, batch_size=10_000):
+    # Catalog from products.csv, stock counted from inventory_items.csv.
+    # The report's time covers both files.
+    start = time.perf_counter()
+    stock = stock_from_inventory(os.path.join(seeds_dir, "inventory_items.csv"))
+    report = import_products(os.path.join(seeds_dir, "products.csv"), catalog, SEED_COLUMNS, stock, batch_size)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def export_products(path, catalog=None):
+    # Writes the catalog in EXPORT_COLUMNS layout (which import_products reads by default)
+    # and returns the number of products written
+    catalog = catalog if catalog is not None else Product.inventory
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE) as file:
+        writer = csv.writer(file)
+        writer.writerow(FIELDS)
+        for product in catalog:
+            writer.writerow(
+                (product.product_id, product.name, product.category, product.quantity, product.price, product.supplier)
+            )
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    from retail_ims import Catalog
+
+    products_path = os.path.join(SEEDS_DIR, "products.csv")
+    inventory_path = os.path.join(SEEDS_DIR, "inventory_items.csv")
+
+    start = time.perf_counter()
+    stock = stock_from_inventory(inventory_path)
+    elapsed = time.perf_counter() - start
+    print(f"inventory_items.csv stock count: {sum(1 for _ in open(inventory_path)) - 1:,} rows in {elapsed:.3f}s")
+
+    Product.inventory = Catalog()
+    print(f"products.csv, batched import:  {import_products(products_path, columns=SEED_COLUMNS, stock=stock)}")
+
+    # The same rows, one Product() per row (add_product can't keep the seed ids)
+    Product.inventory = Catalog()
+    start = time.perf_counter()
+    for product_id, name, category, quantity, price, supplier in product_tuples(products_path, SEED_COLUMNS, stock):
+        Product(product_id, name, category, quantity, price, supplier)
+    elapsed = time.perf_counter() - start
+    print(f"products.csv, one Product() per row: {len(Product.inventory) / elapsed:,.0f} rows/s")
+
+    # A catalog 200x the seeds: export it, then stream it back in
+    Product.inventory = Catalog()
+    Product.inventory.bulk_upsert(
+        (i, f"Product {i}", f"Category {i % 50}", i % 100, 9.99, f"Brand {i % 500}") for i in range(1_000_000)
+    )
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "products.csv")
+        start = time.perf_counter()
+        written = export_products(path)
+        elapsed = time.perf_counter() - start
+        print(f"Export: {written:,} rows in {elapsed:.2f}s ({written / elapsed:,.0f} rows/s)")
+
+        Product.inventory = Catalog()
+        print(f"Import: {import_products(path)}")
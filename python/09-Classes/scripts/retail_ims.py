@@ -1,5 +1,316 @@
+import heapq
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Optimistic concurrency.
+# Every product has a version number that goes up on each change. A writer reads the product
+# (no lock), works out the new values, then commits them only if the version is still the one it
+# read; otherwise someone else got there first and it simply tries again. The compare-and-set
+# itself has to be atomic, which plain Python can't do, so it is done under one of a fixed set
+# of small "stripe" locks, held just for the compare and the write.
+
+_STRIPES = [threading.Lock() for _ in range(64)]
+
+
+def _stripe(product_id):
+    return hash(product_id) % len(_STRIPES)
+
+
+class Catalog:
+    _low_stock_heap = True  # subclasses that can answer low_stock() some other way turn this off
+
+    # Products stored in a dict keyed by product_id, so lookups, updates and deletes are O(1)
+    # however big the catalog gets. Ids come from a counter that only ever goes up, so an id is
+    # never handed out twice, even after deletes (len(inventory) + 1 would collide).
+    # Secondary indexes map each category and supplier to the ids in it.
+    #
+    # Dashboard numbers (total stock value, stock per category and per supplier, products running
+    # low) are kept up to date on every change, by applying just that change's difference, so
+    # reading them never needs a scan of the whole catalog.
+
+    def __init__(self, low_stock_threshold=10):
+        self._products = {}  # product_id -> Product
+        self._by_category = {}  # category -> {product_id: None}, an insertion-ordered set
+        self._by_supplier = {}  # supplier -> {product_id: None}
+        self._next_id = 1
+        self._lock = threading.Lock()  # guards the dict, the indexes and the id counter
+        self.conflicts = 0  # commits that lost a race and had to retry
+
+        self.low_stock_threshold = low_stock_threshold
+        self.total_value = 0  # sum of quantity * price
+        self.category_quantity = {}  # category -> units in stock
+        self.supplier_quantity = {}  # supplier -> units in stock
+        # Min-heap of (quantity, product_id) for products at or below the threshold. Entries are
+        # never updated in place: a change pushes a new one, and outdated ones are skipped on read.
+        self._low_stock = []
+        self._totals_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._products)
+
+    def __contains__(self, product_id):
+        return product_id in self._products
+
+    def __iter__(self):
+        return iter(list(self._products.values()))
+
+    def next_id(self):
+        with self._lock:
+            product_id = self._next_id
+            self._next_id += 1
+            return product_id
+
+    def add(self, product):
+        # Re-using an id replaces the old product
+        self.remove(product.product_id)
+
+        with _STRIPES[_stripe(product.product_id)], self._lock:
+            self._products[product.product_id] = product
+            self._by_category.setdefault(product.category, {})[product.product_id] = None
+            self._by_supplier.setdefault(product.supplier, {})[product.product_id] = None
+
+            # Products created with an explicit id must not collide with future generated ones
+            if isinstance(product.product_id, int) and product.product_id >= self._next_id:
+                self._next_id = product.product_id + 1
+            self._track(product, product.quantity, product.quantity * product.price)
+
+    def get(self, product_id):
+        return self._products.get(product_id)
+
+    def bulk_upsert(self, rows):
+        # rows: (product_id, name, category, quantity, price, supplier) tuples; a row whose id is
+        # already in the catalog updates that product in place. Much cheaper than add_product per
+        # row: no constructor and no separate remove. Returns the count.
+        count = 0
+        for row in rows:
+            product_id = row[0]
+            # Same lock order as add/remove (stripe, then _lock, then _totals_lock in _track), and
+            # the stripe lock keeps this in step with reserve() and compare_and_set()
+            with self._stripe_lock(product_id), self._lock:
+                product = self._products.get(product_id)
+                if product is None:
+                    product = self._products[product_id] = Product.from_row(row)
+                    self._track(product, product.quantity, product.quantity * product.price)
+                else:
+                    self._unindex(self._by_category, product.category, product_id)
+                    self._unindex(self._by_supplier, product.supplier, product_id)
+                    self._track(product, -product.quantity, -product.quantity * product.price, low_stock=False)
+                    product.name, product.category, product.quantity, product.price, product.supplier = row[1:6]
+                    product.version += 1
+                    self._track(product, product.quantity, product.quantity * product.price)
+
+                self._by_category.setdefault(product.category, {})[product_id] = None
+                self._by_supplier.setdefault(product.supplier, {})[product_id] = None
+                if isinstance(product_id, int) and product_id >= self._next_id:
+                    self._next_id = product_id + 1
+            count += 1
+        return count
+
+    @staticmethod
+    def _stripe_lock(product_id):
+        # The lock every stock writer for this product holds while it writes
+        return _STRIPES[_stripe(product_id)]
+
+    @staticmethod
+    @contextmanager
+    def _stripe_locks(product_ids):
+        # The stripe locks of several products, always taken in the same order so two callers
+        # can't deadlock
+        stripes = sorted({_stripe(product_id) for product_id in product_ids})
+        for stripe in stripes:
+            _STRIPES[stripe].acquire()
+        try:
+            yield
+        finally:
+            for stripe in reversed(stripes):
+                _STRIPES[stripe].release()
+
+    def update(self, product_id, quantity=None, price=None, supplier=None, expected_version=None):
+        # Returns the product, None if it doesn't exist, or False if expected_version was given
+        # and the product has changed since (the caller should re-read it and decide again)
+        product = self.get(product_id)
+        if product is None:
+            return None
+
+        # Only update fields that were actually passed in
+        version = product.version if expected_version is None else expected_version
+        if not product.compare_and_set(version, quantity, price, catalog=self):
+            if expected_version is not None:
+                return False
+            # No version to honour: keep the write, on top of whatever changed in between
+            while not product.compare_and_set(product.version, quantity, price, catalog=self):
+                pass
+
+        if supplier is not None and supplier != product.supplier:
+            with _STRIPES[_stripe(product_id)]:
+                with self._totals_lock:
+                    self._add_to(self.supplier_quantity, product.supplier, -product.quantity)
+                    self._add_to(self.supplier_quantity, supplier, product.quantity)
+                self._move_supplier(product, supplier)
+        return product
+
+    def _move_supplier(self, product, supplier):
+        with self._lock:
+            self._unindex(self._by_supplier, product.supplier, product.product_id)
+            product.supplier = supplier
+            self._by_supplier.setdefault(supplier, {})[product.product_id] = None
+
+    def remove(self, product_id):
+        with _STRIPES[_stripe(product_id)], self._lock:
+            product = self._products.pop(product_id, None)
+            if product is None:
+                return None
+
+            self._unindex(self._by_category, product.category, product_id)
+            self._unindex(self._by_supplier, product.supplier, product_id)
+            self._track(product, -product.quantity, -product.quantity * product.price, low_stock=False)
+            return product
+
+    def clear(self):
+        # The id counter is kept, so ids stay unique for the life of the catalog
+        with self._lock:
+            self._products.clear()
+            self._by_category.clear()
+            self._by_supplier.clear()
+        self._reset_totals()
+
+    def _reset_totals(self):
+        with self._totals_lock:
+            self.total_value = 0
+            self.category_quantity = {}
+            self.supplier_quantity = {}
+            self._low_stock = []
+
+    def _changed(self, product, old_quantity, old_price):
+        # Called with the product's stripe lock held, right after its quantity or price changed
+        if self._products.get(product.product_id) is product:
+            self._track(
+                product,
+                product.quantity - old_quantity,
+                product.quantity * product.price - old_quantity * old_price,
+            )
+
+    def _track(self, product, quantity_change, value_change, low_stock=True):
+        with self._totals_lock:
+            self.total_value += value_change
+            if quantity_change:
+                self._add_to(self.category_quantity, product.category, quantity_change)
+                self._add_to(self.supplier_quantity, product.supplier, quantity_change)
+            if low_stock and self._low_stock_heap and product.quantity <= self.low_stock_threshold:
+                heapq.heappush(self._low_stock, (product.quantity, product.product_id))
+                if len(self._low_stock) > 64 and len(self._low_stock) > 4 * len(self._products):
+                    self._compact_low_stock()
+
+    @staticmethod
+    def _add_to(totals, key, amount):
+        totals[key] = totals.get(key, 0) + amount
+
+    def _is_current(self, entry):
+        quantity, product_id = entry
+        product = self._products.get(product_id)
+        return product is not None and product.quantity == quantity and quantity <= self.low_stock_threshold
+
+    def _compact_low_stock(self):
+        # Drop outdated entries once they outnumber the products (called with _totals_lock held)
+        self._low_stock = [entry for entry in set(self._low_stock) if self._is_current(entry)]
+        heapq.heapify(self._low_stock)
+
+    def low_stock(self, limit=10):
+        # The products with the least stock (at or below the threshold), lowest first.
+        # Only the top of the heap is looked at, not the whole catalog.
+        found = []
+        seen = set()
+        with self._totals_lock:
+            heap = self._low_stock
+            kept = []
+            while heap and len(found) < limit:
+                entry = heapq.heappop(heap)
+                if entry[1] in seen or not self._is_current(entry):
+                    continue  # outdated: leave it out of the heap for good
+                seen.add(entry[1])
+                kept.append(entry)
+                found.append(self._products[entry[1]])
+            for entry in kept:
+                heapq.heappush(heap, entry)
+        return found
+
+    def dashboard(self):
+        # A consistent copy of the running totals
+        with self._totals_lock:
+            return {
+                "products": len(self),
+                "total_value": self.total_value,
+                "category_quantity": dict(self.category_quantity),
+                "supplier_quantity": dict(self.supplier_quantity),
+            }
+
+    def reserve(self, lines, max_attempts=100):
+        # Takes stock for every (product_id, quantity) line, or for none of them.
+        # Everything is checked before anything is changed, so a failed order leaves stock untouched.
+        # Returns None on success, otherwise the reason the order was rejected.
+        needed = {}
+        for product_id, quantity in lines:
+            if quantity <= 0:
+                return f"Invalid quantity {quantity} for product {product_id}"
+            needed[product_id] = needed.get(product_id, 0) + quantity
+
+        for _ in range(max_attempts):
+            # Read phase: no locks held, just note the version each decision was based on
+            staged = []
+            for product_id, quantity in needed.items():
+                product = self.get(product_id)
+                if product is None:
+                    return f"Product {product_id} not found"
+                version = product.version
+                if product.quantity < quantity:
+                    return f"Insufficient stock for {product.name}"
+                staged.append((product, version, quantity))
+
+            if self._commit(staged):
+                return None
+            with self._lock:
+                self.conflicts += 1
+
+        return "Too many conflicting updates, please retry"
+
+    def _commit(self, staged):
+        # Multi-product compare-and-set: lock the stripes involved, check no version moved,
+        # then write every line
+        with self._stripe_locks(product.product_id for product, _, _ in staged):
+            for product, version, _ in staged:
+                if product.version != version:
+                    return False
+            for product, _, quantity in staged:
+                product.quantity -= quantity
+                product.version += 1
+                self._changed(product, product.quantity + quantity, product.price)
+            self._save_stock(staged)
+            return True
+
+    def _save_stock(self, staged):
+        # Called by _commit with the stripes still held, once the new stock is written.
+        # Catalogs that store products somewhere else persist it here, in step with memory.
+        pass
+
+    def by_category(self, category):
+        return [self._products[product_id] for product_id in self._by_category.get(category, ())]
+
+    def by_supplier(self, supplier):
+        return [self._products[product_id] for product_id in self._by_supplier.get(supplier, ())]
+
+    @staticmethod
+    def _unindex(index, key, product_id):
+        product_ids = index.get(key)
+        if product_ids is not None:
+            product_ids.pop(product_id, None)
+            if not product_ids:
+                del index[key]
+
+
 class Product:
-    inventory = []  # class-level variable: shared by ALL instances
+    inventory = Catalog()  # class-level variable: shared by ALL instances
 
     def __init__(self, product_id, name, category, quantity, price, supplier):
         self.product_id = product_id
@@ -8,12 +319,39 @@ class Product:
         self.quantity = quantity
         self.price = price
         self.supplier = supplier
-        Product.inventory.append(self)
+        self.version = 0  # goes up on every change to quantity or price
+        Product.inventory.add(self)
+
+    def compare_and_set(self, expected_version, quantity=None, price=None, catalog=None):
+        # Writes the new values only if nobody has changed the product since expected_version.
+        # `catalog` is the one holding this product (Product.inventory unless given), so its
+        # running totals see the change.
+        catalog = catalog if catalog is not None else Product.inventory
+        with _STRIPES[_stripe(self.product_id)]:
+            if self.version != expected_version:
+                return False
+            old_quantity, old_price = self.quantity, self.price
+            if quantity is not None:
+                self.quantity = quantity
+            if price is not None:
+                self.price = price
+            self.version += 1
+            catalog._changed(self, old_quantity, old_price)
+            return True
+
+    @classmethod
+    def from_row(cls, row):
+        # Build a product from a (product_id, name, category, quantity, price, supplier[, version])
+        # tuple without registering it: the caller (a catalog) stores it itself
+        product = cls.__new__(cls)
+        product.product_id, product.name, product.category, product.quantity, product.price, product.supplier = row[:6]
+        product.version = row[6] if len(row) > 6 else 0
+        return product
 
     @classmethod
     def add_product(cls, name, category, quantity, price, supplier):
         # Auto-generate an incremental product_id with no duplicates
-        product_id = len(cls.inventory) + 1
+        product_id = cls.inventory.next_id()
 
         # Create a new Product object using the constructor
         new_product = cls(product_id, name, category, quantity, price, supplier)
@@ -21,27 +359,20 @@ class Product:
         return "Product added successfully"
 
     @classmethod
-    def update_product(cls, product_id, quantity=None, price=None, supplier=None):
-        for product in cls.inventory:
-            if product.product_id == product_id:
-                # Only update fields that were actually passed in
-                if quantity is not None:
-                    product.quantity = quantity
-                if price is not None:
-                    product.price = price
-                if supplier is not None:
-                    product.supplier = supplier
-                return "Product information updated successfully"
-        return "Product not found"
+    def update_product(cls, product_id, quantity=None, price=None, supplier=None, expected_version=None):
+        # Pass expected_version (product.version when you read it) to refuse overwriting a newer change
+        result = cls.inventory.update(product_id, quantity, price, supplier, expected_version)
+        if result is None:
+            return "Product not found"
+        if result is False:
+            return "Product was changed by someone else, please reload it"
+        return "Product information updated successfully"
 
     @classmethod
     def delete_product(cls, product_id):
-        for product in cls.inventory:
-            if product.product_id == product_id:
-                cls.inventory.remove(product)
-                return "Product deleted successfully"
-
-        return "Product not found"
+        if cls.inventory.remove(product_id) is None:
+            return "Product not found"
+        return "Product deleted successfully"
 
 
 class Order:
@@ -49,32 +380,104 @@ class Order:
         self.order_id = order_id
         self.products = products  # A list of (product_id, quantity) tuples
         self.customer_info = customer_info
+        self.status = "pending"
 
     def place_order(self, product_id, quantity, customer_info=None):
+        # Reduce the product's stock, but only if there is enough of it
+        error = Product.inventory.reserve([(product_id, quantity)])
+        if error is not None:
+            return f"Order failed: {error}"
+
         self.products.append((product_id, quantity))
+        self.status = "placed"
+        if customer_info is not None:
+            self.customer_info = customer_info
 
+        return f"Order placed successfully. Order ID: {self.order_id}"
+
+    def place(self, customer_info=None):
+        # Place every line in self.products at once: all lines get their stock, or none do
         if customer_info is not None:
             self.customer_info = customer_info
 
-        # Find the product in inventory and reduce its stock
-        for product in Product.inventory:
-            if product.product_id == product_id:
-                product.quantity -= quantity
+        error = Product.inventory.reserve(self.products)
+        if error is not None:
+            self.status = "rejected"
+            return f"Order failed: {error}"
 
+        self.status = "placed"
         return f"Order placed successfully. Order ID: {self.order_id}"
 
 
-p1 = Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
-print(p1)  # Product added successfully
-print(Product.inventory[0].quantity)  # 50 — before order
+class OrderBatchReport:
+    def __init__(self, placed, rejected, seconds):
+        self.placed = placed
+        self.rejected = rejected  # A list of (order_id, reason) tuples
+        self.seconds = seconds
+
+    @property
+    def per_second(self):
+        total = self.placed + len(self.rejected)
+        return total / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self):
+        return (
+            f"{self.placed:,} orders placed, {len(self.rejected):,} rejected in {self.seconds:.4f}s "
+            f"({self.per_second:,.0f} orders/s)"
+        )
+
+
+def process_orders(orders):
+    # Places a queue of orders in one pass, in the order they arrived.
+    # Each line is found through the catalog's id index, so the cost is O(total lines)
+    # rather than O(orders x catalog size).
+    start = time.perf_counter()
+    placed = 0
+    rejected = []
+    for order in orders:
+        error = Product.inventory.reserve(order.products)
+        if error is None:
+            order.status = "placed"
+            placed += 1
+        else:
+            order.status = "rejected"
+            rejected.append((order.order_id, error))
+    return OrderBatchReport(placed, rejected, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    p1 = Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+    print(p1)  # Product added successfully
+    print(Product.inventory.get(1).quantity)  # 50 — before order
+
+    update_p1 = Product.update_product(1, quantity=45, price=950)
+    print(update_p1)  # Product information updated successfully
+
+    order = Order(order_id=1, products=[])
+    order_placement = order.place_order(1, 2, customer_info="John Doe")
+    print(order_placement)  # Order placed successfully. Order ID: 1
+    print(Product.inventory.get(1).quantity)  # 43 — after order, correctly reduced
+
+    delete_p1 = Product.delete_product(1)
+    print(delete_p1)  # Product deleted successfully
 
-update_p1 = Product.update_product(1, quantity=45, price=950)
-print(update_p1)  # Product information updated successfully
+    # Flash sale: 10,000 orders of up to 5 lines each, all after the same 1,000 hot products,
+    # in a 100,000-product catalog. Once a hot product sells out, orders that need it are rejected.
+    import random
 
-order = Order(order_id=1, products=[])
-order_placement = order.place_order(1, 2, customer_info="John Doe")
-print(order_placement)  # Order placed successfully. Order ID: 1
-print(Product.inventory[0].quantity)  # 48 — after order, correctly reduced
+    for i in range(100_000):
+        Product.add_product(f"Product {i}", "Flash sale", 20, 10, "Supplier A")
+    hot_ids = [product.product_id for product in Product.inventory][:1_000]
+    orders = [
+        Order(order_id, [(random.choice(hot_ids), random.randint(1, 5)) for _ in range(random.randint(1, 5))])
+        for order_id in range(10_000)
+    ]
+    print(process_orders(orders))
 
-delete_p1 = Product.delete_product(1)
-print(delete_p1)  # Product deleted successfully
+    # Dashboard numbers come from the running totals, no scan of the 100,000 products
+    start = time.perf_counter()
+    dashboard = Product.inventory.dashboard()
+    lowest = Product.inventory.low_stock(5)
+    elapsed = time.perf_counter() - start
+    print(f"Stock value: {dashboard['total_value']:,.0f}, units by supplier: {dashboard['supplier_quantity']}")
+    print(f"Lowest stock: {[(p.name, p.quantity) for p in lowest]} (read in {elapsed * 1e6:.0f} µs)")
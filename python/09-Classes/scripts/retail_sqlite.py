@@ -0,0 +1,347 @@
+import sqlite3
+import threading
+
+from retail_ims import Catalog, Order, Product
+
+# SQLite storage for the catalog and orders.
+# SQLiteCatalog is a drop-in Catalog: set Product.inventory = SQLiteCatalog("shop.db") and the
+# existing classmethods (add_product, update_product, delete_product) and Order.place keep working,
+# but every change is written to disk and survives a restart.
+#
+# - Products are loaded lazily: only when they're first asked for, then kept in memory so the same
+#   product is always the same object (the optimistic version checks rely on that).
+# - The dashboard totals are read from SQL once when the file is opened, then kept up to date in
+#   memory like the plain Catalog's; a bulk load applies just the difference of the rows it replaced.
+#   Low stock is an indexed query.
+# - Large catalogs go in with bulk_upsert: one executemany call in one transaction, instead of one
+#   Product object and one commit per row.
+# - WAL mode lets readers keep reading while a write is in progress, and with synchronous=NORMAL a
+#   commit doesn't wait for a full disk flush every time.
+# - A product's row is only ever written with that product's stripe lock held (the lock its
+#   in-memory stock changes happen under), so the row and the object never drift apart.
+# - The SQL strings are constants, so sqlite3 compiles each one once and reuses the prepared statement.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    product_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    category TEXT,
+    quantity INTEGER NOT NULL,
+    price REAL NOT NULL,
+    supplier TEXT,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS products_category ON products (category);
+CREATE INDEX IF NOT EXISTS products_supplier ON products (supplier);
+CREATE INDEX IF NOT EXISTS products_quantity ON products (quantity, product_id);
+CREATE TABLE IF NOT EXISTS orders (
+    order_id INTEGER PRIMARY KEY,
+    customer_info TEXT,
+    status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS order_lines (
+    order_id INTEGER NOT NULL REFERENCES orders (order_id),
+    line INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    PRIMARY KEY (order_id, line)
+);
+"""
+
+COLUMNS = "product_id, name, category, quantity, price, supplier, version"
+
+UPSERT_PRODUCT = f"""
+INSERT INTO products ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (product_id) DO UPDATE SET
+    name = excluded.name, category = excluded.category, quantity = excluded.quantity,
+    price = excluded.price, supplier = excluded.supplier, version = excluded.version
+"""
+# Bulk loads never set a version: a new row starts at 0 and an existing one moves one past its own,
+# so anyone holding an older version is refused by the optimistic check
+BULK_UPSERT_PRODUCT = f"""
+INSERT INTO products ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, 0)
+ON CONFLICT (product_id) DO UPDATE SET
+    name = excluded.name, category = excluded.category, quantity = excluded.quantity,
+    price = excluded.price, supplier = excluded.supplier, version = products.version + 1
+"""
+# Stock writes can reach the database out of order when threads race, so never go back a version
+SAVE_STOCK = "UPDATE products SET quantity = ?, price = ?, version = ? WHERE product_id = ? AND version < ?"
+# Same rule for whole-product updates; an equal version is allowed, since a supplier change doesn't bump it
+SAVE_PRODUCT = """
+UPDATE products SET name = ?, category = ?, quantity = ?, price = ?, supplier = ?, version = ?
+WHERE product_id = ? AND version <= ?
+"""
+SELECT_PRODUCT = f"SELECT {COLUMNS} FROM products WHERE product_id = ?"
+SELECT_STOCK = "SELECT product_id, category, quantity, price, supplier FROM products WHERE product_id IN ({})"
+IN_CHUNK = 500  # ids per IN (...) query, well under SQLite's limit on parameters
+UPSERT_ORDER = """
+INSERT INTO orders (order_id, customer_info, status) VALUES (?, ?, ?)
+ON CONFLICT (order_id) DO UPDATE SET customer_info = excluded.customer_info, status = excluded.status
+"""
+
+
+def _row(product):
+    return (
+        product.product_id, product.name, product.category, product.quantity, product.price, product.supplier,
+        getattr(product, "version", 0),
+    )
+
+
+class SQLiteCatalog(Catalog):
+    _low_stock_heap = False  # the quantity index answers low_stock() directly
+
+    def __init__(self, path=":memory:", low_stock_threshold=10):
+        super().__init__(low_stock_threshold)
+        # One connection shared by every thread; _db_lock makes sure only one uses it at a time
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self._db_lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(SCHEMA)
+            # AUTOINCREMENT makes SQLite remember the largest id ever stored, even once it's deleted,
+            # so ids are still never reused after a restart
+            row = self.connection.execute("SELECT seq FROM sqlite_sequence WHERE name = 'products'").fetchone()
+        self._next_id = (row[0] if row else 0) + 1
+        self._load_totals()
+
+    def _load_totals(self):
+        total_value = self._query("SELECT COALESCE(SUM(quantity * price), 0) FROM products")[0][0]
+        categories = self._query("SELECT category, SUM(quantity) FROM products GROUP BY category")
+        suppliers = self._query("SELECT supplier, SUM(quantity) FROM products GROUP BY supplier")
+        with self._totals_lock:
+            self.total_value = total_value
+            self.category_quantity = dict(categories)
+            self.supplier_quantity = dict(suppliers)
+
+    def close(self):
+        with self._db_lock:
+            self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _query(self, sql, parameters=()):
+        with self._db_lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def _write(self, sql, rows):
+        with self._db_lock, self.connection:
+            self.connection.executemany(sql, rows)
+
+    def __len__(self):
+        return self._query("SELECT COUNT(*) FROM products")[0][0]
+
+    def __contains__(self, product_id):
+        return self.get(product_id) is not None
+
+    def __iter__(self):
+        return iter(self._load(self._query(f"SELECT {COLUMNS} FROM products ORDER BY product_id")))
+
+    def _load(self, rows):
+        # Turn rows into products, reusing any that are already in memory
+        products = []
+        with self._lock:
+            for row in rows:
+                product = self._products.get(row[0])
+                if product is None:
+                    product = self._products[row[0]] = Product.from_row(row)
+                products.append(product)
+        return products
+
+    def add(self, product):
+        # Re-using an id replaces the old product
+        replaced = self.get(product.product_id)
+        with self._stripe_lock(product.product_id):
+            self._write(UPSERT_PRODUCT, [_row(product)])
+            with self._lock:
+                self._products[product.product_id] = product
+                if product.product_id >= self._next_id:
+                    self._next_id = product.product_id + 1
+        if replaced is not None:
+            self._track(replaced, -replaced.quantity, -replaced.quantity * replaced.price)
+        self._track(product, product.quantity, product.quantity * product.price)
+
+    def bulk_upsert(self, rows):
+        # rows: (product_id, name, category, quantity, price, supplier) tuples.
+        # Returns how many were written. Products already in memory are refreshed to match.
+        rows = [tuple(row[:6]) for row in rows]
+        # Hold every stripe the batch touches (in order, like _commit) across the write and the
+        # in-memory refresh, so no stock writer can slip in between and split the versions
+        with self._stripe_locks(row[0] for row in rows):
+            # The rows being replaced, so the totals can move by the difference
+            current = self._stock_rows(list({row[0] for row in rows}))
+            self._write(BULK_UPSERT_PRODUCT, rows)
+            for row in rows:
+                product = self._products.get(row[0])
+                if product is not None:
+                    # Same bump as the SQL above
+                    product.name, product.category, product.quantity, product.price, product.supplier = row[1:]
+                    product.version += 1
+            self._track_rows(current, rows)
+        if rows:
+            with self._lock:
+                self._next_id = max(self._next_id, max(row[0] for row in rows) + 1)
+        return len(rows)
+
+    def _stock_rows(self, product_ids):
+        # product_id -> (category, quantity, price, supplier) for the ids that are stored
+        found = {}
+        for start in range(0, len(product_ids), IN_CHUNK):
+            chunk = product_ids[start : start + IN_CHUNK]
+            for product_id, *stock in self._query(SELECT_STOCK.format(", ".join("?" * len(chunk))), chunk):
+                found[product_id] = tuple(stock)
+        return found
+
+    def _track_rows(self, current, rows):
+        # Running totals for a bulk load: take out each replaced row, add its new one.
+        # The differences are summed first, then applied in one go like _track applies one product's.
+        value_change = 0
+        category_changes = {}
+        supplier_changes = {}
+        for product_id, _, category, quantity, price, supplier in rows:
+            old = current.get(product_id)
+            if old is not None:
+                old_category, old_quantity, old_price, old_supplier = old
+                value_change -= old_quantity * old_price
+                self._add_to(category_changes, old_category, -old_quantity)
+                self._add_to(supplier_changes, old_supplier, -old_quantity)
+            # A repeated id replaces the row before it in the same batch
+            current[product_id] = (category, quantity, price, supplier)
+            value_change += quantity * price
+            self._add_to(category_changes, category, quantity)
+            self._add_to(supplier_changes, supplier, quantity)
+
+        with self._totals_lock:
+            self.total_value += value_change
+            for category, change in category_changes.items():
+                if change:
+                    self._add_to(self.category_quantity, category, change)
+            for supplier, change in supplier_changes.items():
+                if change:
+                    self._add_to(self.supplier_quantity, supplier, change)
+
+    def get(self, product_id):
+        product = self._products.get(product_id)
+        if product is not None:
+            return product
+        rows = self._query(SELECT_PRODUCT, (product_id,))
+        return self._load(rows)[0] if rows else None
+
+    def update(self, product_id, quantity=None, price=None, supplier=None, expected_version=None):
+        product = super().update(product_id, quantity, price, supplier, expected_version)
+        if product:
+            # The row is read under the stripe lock, so it is the product's latest state
+            with self._stripe_lock(product_id):
+                row = _row(product)
+                self._write(SAVE_PRODUCT, [(*row[1:], product_id, row[6])])
+        return product
+
+    def _move_supplier(self, product, supplier):
+        # The supplier index is the database's own, so there is nothing to keep in memory
+        product.supplier = supplier
+
+    def remove(self, product_id):
+        product = self.get(product_id)
+        if product is None:
+            return None
+        with self._stripe_lock(product_id):
+            self._write("DELETE FROM products WHERE product_id = ?", [(product_id,)])
+            with self._lock:
+                self._products.pop(product_id, None)
+        self._track(product, -product.quantity, -product.quantity * product.price)
+        return product
+
+    def clear(self):
+        self._write("DELETE FROM products", [()])
+        with self._lock:
+            self._products.clear()
+        self._reset_totals()
+
+    def low_stock(self, limit=10):
+        rows = self._query(
+            f"SELECT {COLUMNS} FROM products WHERE quantity <= ? ORDER BY quantity, product_id LIMIT ?",
+            (self.low_stock_threshold, limit),
+        )
+        return self._load(rows)
+
+    def _save_stock(self, staged):
+        # Runs inside _commit with the stripes held, so the rows change together with the objects
+        self._write(
+            SAVE_STOCK,
+            [(p.quantity, p.price, p.version, p.product_id, p.version) for p, _, _ in staged],
+        )
+
+    def by_category(self, category):
+        rows = self._query(f"SELECT {COLUMNS} FROM products WHERE category = ? ORDER BY product_id", (category,))
+        return self._load(rows)
+
+    def by_supplier(self, supplier):
+        rows = self._query(f"SELECT {COLUMNS} FROM products WHERE supplier = ? ORDER BY product_id", (supplier,))
+        return self._load(rows)
+
+    def save_orders(self, orders):
+        # Stores the orders and their lines in one transaction
+        orders = list(orders)
+        order_rows = [(order.order_id, order.customer_info, order.status) for order in orders]
+        line_rows = [
+            (order.order_id, line, product_id, quantity)
+            for order in orders
+            for line, (product_id, quantity) in enumerate(order.products)
+        ]
+        with self._db_lock, self.connection:
+            self.connection.executemany(UPSERT_ORDER, order_rows)
+            self.connection.executemany("DELETE FROM order_lines WHERE order_id = ?", [(row[0],) for row in order_rows])
+            self.connection.executemany(
+                "INSERT INTO order_lines (order_id, line, product_id, quantity) VALUES (?, ?, ?, ?)", line_rows
+            )
+        return len(orders)
+
+    def load_order(self, order_id):
+        rows = self._query("SELECT customer_info, status FROM orders WHERE order_id = ?", (order_id,))
+        if not rows:
+            return None
+        customer_info, status = rows[0]
+        lines = self._query(
+            "SELECT product_id, quantity FROM order_lines WHERE order_id = ? ORDER BY line", (order_id,)
+        )
+        order = Order(order_id, [tuple(line) for line in lines], customer_info)
+        order.status = status
+        return order
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "shop.db")
+
+        Product.inventory = SQLiteCatalog(path)
+        start = time.perf_counter()
+        for i in range(10_000):
+            Product.add_product(f"Product {i}", "General", 100, 9.99, "Supplier A")
+        elapsed = time.perf_counter() - start
+        print(f"add_product, one at a time: {10_000 / elapsed:>10,.0f} products/s")
+
+        rows = [(i, f"Product {i}", "General", 100, 9.99, "Supplier B") for i in range(10_001, 1_010_001)]
+        start = time.perf_counter()
+        Product.inventory.bulk_upsert(rows)
+        elapsed = time.perf_counter() - start
+        print(f"bulk_upsert:                {len(rows) / elapsed:>10,.0f} products/s")
+
+        order = Order(1, [(1, 2), (20_000, 5)], customer_info="John Doe")
+        print(order.place())
+        Product.inventory.save_orders([order])
+        Product.inventory.close()
+
+        # A fresh catalog on the same file: nothing is loaded until it's asked for
+        Product.inventory = SQLiteCatalog(path)
+        start = time.perf_counter()
+        print(f"After restart: {len(Product.inventory):,} products, product 1 has {Product.inventory.get(1).quantity} left")
+        print(f"Order 1 is {Product.inventory.load_order(1).status}, reopened in {time.perf_counter() - start:.4f}s")
+        Product.inventory.close()
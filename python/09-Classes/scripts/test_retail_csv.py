@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from retail_csv import SEEDS_DIR, export_products, import_products, import_seeds
+from retail_ims import Catalog, Product
+from retail_sqlite import SQLiteCatalog
+
+
+class TestRetailCsv(unittest.TestCase):
+
+    def setUp(self):
+        Product.inventory = Catalog()
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write(self, name, text):
+        path = os.path.join(self.folder, name)
+        with open(path, "w", newline="") as file:
+            file.write(text)
+        return path
+
+    def test_import_coerces_and_dedupes(self):
+        path = self.write("products.csv", (
+            "product_id,name,category,quantity,price,supplier\n"
+            "1, Laptop ,Electronics,50,999.5,Supplier A\n"
+            "2,Mouse,Electronics,lots,25,Supplier B\n"
+            "3,Desk,Furniture,10,300\n"
+            "1,Laptop,Electronics,40,950,Supplier A\n"
+        ))
+        report = import_products(path, batch_size=2)
+
+        self.assertEqual((report.rows, report.imported, report.duplicates), (4, 1, 1))
+        self.assertEqual([line for line, _ in report.errors], [3, 4])
+        laptop = Product.inventory.get(1)
+        self.assertEqual((laptop.name, laptop.quantity, laptop.price), ("Laptop", 40, 950.0))
+        self.assertEqual(Product.inventory.total_value, 40 * 950)
+
+    def test_missing_column(self):
+        path = self.write("products.csv", "product_id,name\n1,Laptop\n")
+        with self.assertRaises(ValueError):
+            import_products(path)
+
+    def test_export_then_import_round_trip(self):
+        Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+        Product.add_product("Scarf, wool", "Accessories", 3, 19.99, "Supplier B")
+        path = os.path.join(self.folder, "export.csv")
+        self.assertEqual(export_products(path), 2)
+
+        with SQLiteCatalog() as catalog:
+            report = import_products(path, catalog)
+            self.assertEqual(report.imported, 2)
+            scarf = catalog.get(2)
+            self.assertEqual((scarf.name, scarf.quantity, scarf.price), ("Scarf, wool", 3, 19.99))
+
+    @unittest.skipUnless(os.path.exists(os.path.join(SEEDS_DIR, "products.csv")), "dbt seed files not present")
+    def test_seed_import(self):
+        report = import_seeds()
+        self.assertEqual(report.errors, [])
+        self.assertEqual(len(Product.inventory), report.imported)
+        self.assertGreater(sum(Product.inventory.category_quantity.values()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import unittest
+
+from retail_ims import Catalog, Order, Product, process_orders
+
+
+class TestCatalog(unittest.TestCase):
+
+    def setUp(self):
+        Product.inventory = Catalog()
+
+    def test_ids_are_never_reused_after_delete(self):
+        Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+        Product.add_product("Mouse", "Electronics", 200, 25, "Supplier B")
+        Product.delete_product(2)
+        Product.add_product("Desk", "Furniture", 10, 300, "Supplier A")
+
+        self.assertNotIn(2, Product.inventory)
+        self.assertEqual(Product.inventory.get(3).name, "Desk")
+        self.assertEqual(len(Product.inventory), 2)
+
+    def test_explicit_ids_move_the_counter(self):
+        Product(10, "Chair", "Furniture", 5, 80, "Supplier C")
+        Product.add_product("Lamp", "Furniture", 5, 40, "Supplier C")
+        self.assertEqual(Product.inventory.get(11).name, "Lamp")
+
+    def test_update_and_delete(self):
+        Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+        self.assertEqual(Product.update_product(1, quantity=45, price=950), "Product information updated successfully")
+        self.assertEqual(Product.inventory.get(1).quantity, 45)
+        self.assertEqual(Product.inventory.get(1).price, 950)
+        self.assertEqual(Product.update_product(99, quantity=1), "Product not found")
+
+        self.assertEqual(Product.delete_product(1), "Product deleted successfully")
+        self.assertEqual(Product.delete_product(1), "Product not found")
+
+    def test_category_and_supplier_indexes(self):
+        Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+        Product.add_product("Mouse", "Electronics", 200, 25, "Supplier B")
+        Product.add_product("Desk", "Furniture", 10, 300, "Supplier A")
+
+        self.assertEqual([p.name for p in Product.inventory.by_category("Electronics")], ["Laptop", "Mouse"])
+        self.assertEqual([p.name for p in Product.inventory.by_supplier("Supplier A")], ["Laptop", "Desk"])
+
+        Product.update_product(1, supplier="Supplier B")
+        self.assertEqual([p.name for p in Product.inventory.by_supplier("Supplier A")], ["Desk"])
+        self.assertEqual([p.name for p in Product.inventory.by_supplier("Supplier B")], ["Mouse", "Laptop"])
+
+        Product.delete_product(3)
+        self.assertEqual(Product.inventory.by_category("Furniture"), [])
+
+    def test_place_order_reduces_stock(self):
+        Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+        order = Order(order_id=1, products=[])
+        order.place_order(1, 2, customer_info="John Doe")
+        self.assertEqual(Product.inventory.get(1).quantity, 48)
+
+    def test_place_order_checks_stock(self):
+        Product.add_product("Laptop", "Electronics", 5, 1000, "Supplier A")
+        order = Order(order_id=1, products=[])
+        self.assertEqual(order.place_order(1, 6), "Order failed: Insufficient stock for Laptop")
+        self.assertEqual(order.place_order(2, 1), "Order failed: Product 2 not found")
+        self.assertEqual(order.products, [])
+        self.assertEqual(Product.inventory.get(1).quantity, 5)
+
+
+class TestBatchOrders(unittest.TestCase):
+
+    def setUp(self):
+        Product.inventory = Catalog()
+        Product.add_product("Laptop", "Electronics", 10, 1000, "Supplier A")
+        Product.add_product("Mouse", "Electronics", 3, 25, "Supplier B")
+
+    def test_multi_line_order_is_all_or_nothing(self):
+        order = Order(1, [(1, 2), (2, 2), (2, 2)])  # 4 mice wanted, only 3 in stock
+        self.assertEqual(order.place(), "Order failed: Insufficient stock for Mouse")
+        self.assertEqual(order.status, "rejected")
+        self.assertEqual(Product.inventory.get(1).quantity, 10)
+        self.assertEqual(Product.inventory.get(2).quantity, 3)
+
+        order = Order(2, [(1, 2), (2, 3)])
+        self.assertEqual(order.place(customer_info="Jane"), "Order placed successfully. Order ID: 2")
+        self.assertEqual(Product.inventory.get(1).quantity, 8)
+        self.assertEqual(Product.inventory.get(2).quantity, 0)
+
+    def test_process_orders_queue(self):
+        orders = [Order(i, [(1, 1), (2, 1)]) for i in range(5)]
+        orders.append(Order(5, [(3, 1)]))
+        orders.append(Order(6, [(1, 0)]))
+        report = process_orders(orders)
+
+        self.assertEqual(report.placed, 3)
+        self.assertEqual(
+            report.rejected,
+            [
+                (3, "Insufficient stock for Mouse"),
+                (4, "Insufficient stock for Mouse"),
+                (5, "Product 3 not found"),
+                (6, "Invalid quantity 0 for product 1"),
+            ],
+        )
+        self.assertEqual([order.status for order in orders[:4]], ["placed", "placed", "placed", "rejected"])
+        self.assertEqual(Product.inventory.get(1).quantity, 7)
+
+
+class TestOptimisticUpdates(unittest.TestCase):
+
+    def setUp(self):
+        Product.inventory = Catalog()
+        Product.add_product("Laptop", "Electronics", 10, 1000, "Supplier A")
+        self.laptop = Product.inventory.get(1)
+
+    def test_compare_and_set(self):
+        self.assertEqual(self.laptop.version, 0)
+        self.assertTrue(self.laptop.compare_and_set(0, quantity=8))
+        self.assertFalse(self.laptop.compare_and_set(0, quantity=5))
+        self.assertEqual((self.laptop.quantity, self.laptop.version), (8, 1))
+
+    def test_update_product_with_stale_version(self):
+        version = self.laptop.version
+        Order(1, [(1, 2)]).place()
+        self.assertEqual(
+            Product.update_product(1, price=900, expected_version=version),
+            "Product was changed by someone else, please reload it",
+        )
+        self.assertEqual(self.laptop.price, 1000)
+        self.assertEqual(
+            Product.update_product(1, price=900, expected_version=self.laptop.version),
+            "Product information updated successfully",
+        )
+        self.assertEqual(self.laptop.price, 900)
+
+    def test_threads_never_oversell(self):
+        from retail_contention import run_contention
+
+        result = run_contention(workers=4, orders_per_worker=500, hot_products=2, stock=300)
+        self.assertFalse(result["oversold"])
+        self.assertLess(result["placed"], result["orders"])
+
+
+class TestAggregates(unittest.TestCase):
+
+    def setUp(self):
+        Product.inventory = Catalog(low_stock_threshold=5)
+        Product.add_product("Laptop", "Electronics", 10, 1000, "Supplier A")
+        Product.add_product("Mouse", "Electronics", 4, 25, "Supplier B")
+        Product.add_product("Desk", "Furniture", 6, 300, "Supplier A")
+
+    def assertMatchesFullScan(self):
+        catalog = Product.inventory
+        expected_value = sum(p.quantity * p.price for p in catalog)
+        categories, suppliers = {}, {}
+        for p in catalog:
+            categories[p.category] = categories.get(p.category, 0) + p.quantity
+            suppliers[p.supplier] = suppliers.get(p.supplier, 0) + p.quantity
+
+        dashboard = catalog.dashboard()
+        self.assertEqual(dashboard["total_value"], expected_value)
+        self.assertEqual({k: v for k, v in dashboard["category_quantity"].items() if v}, categories)
+        self.assertEqual({k: v for k, v in dashboard["supplier_quantity"].items() if v}, suppliers)
+
+    def test_totals_follow_every_change(self):
+        self.assertEqual(Product.inventory.total_value, 10_000 + 100 + 1_800)
+        Product.update_product(1, quantity=8, price=900, supplier="Supplier C")
+        Order(1, [(2, 1), (3, 2)]).place()
+        Order(2, [], "Jane").place_order(1, 3)
+        Product.delete_product(2)
+        Product(2, "Mouse", "Electronics", 50, 20, "Supplier B")
+        self.assertMatchesFullScan()
+        self.assertEqual(Product.inventory.supplier_quantity["Supplier C"], 5)
+
+    def test_totals_of_a_catalog_that_is_not_product_inventory(self):
+        catalog = Catalog()
+        catalog.bulk_upsert([(1, "Pen", "Office", 5, 2.0, "Supplier A")])
+        catalog.update(1, quantity=50)
+        self.assertEqual(catalog.get(1).quantity, 50)
+        self.assertEqual(catalog.total_value, 100.0)
+        self.assertEqual(catalog.category_quantity, {"Office": 50})
+        # The global catalog is untouched
+        self.assertNotIn("Office", Product.inventory.category_quantity)
+
+    def test_bulk_reload_alongside_orders(self):
+        import threading
+
+        catalog = Product.inventory
+        catalog.bulk_upsert([(i, f"Item {i}", "Bulk", 1_000_000, 1, "Supplier A") for i in range(10, 20)])
+        orders = [Order(i, [(10 + i % 10, 1)]) for i in range(5_000)]
+        reloader = threading.Thread(
+            target=lambda: [catalog.bulk_upsert([(i, f"Item {i}", "Bulk", 1_000_000, 1, "Supplier A")
+                                                 for i in range(10, 20)]) for _ in range(200)]
+        )
+        reloader.start()
+        process_orders(orders)
+        reloader.join()
+        self.assertMatchesFullScan()
+
+    def test_low_stock_heap(self):
+        self.assertEqual([p.name for p in Product.inventory.low_stock()], ["Mouse"])
+        Order(1, [(1, 7), (3, 1)]).place()  # Laptop 3, Desk 5
+        self.assertEqual([(p.name, p.quantity) for p in Product.inventory.low_stock()],
+                         [("Laptop", 3), ("Mouse", 4), ("Desk", 5)])
+        self.assertEqual([p.name for p in Product.inventory.low_stock(limit=1)], ["Laptop"])
+
+        Product.update_product(1, quantity=100)  # restocked: drops off the list
+        Product.delete_product(2)
+        self.assertEqual([p.name for p in Product.inventory.low_stock()], ["Desk"])
+
+    def test_outdated_heap_entries_are_compacted(self):
+        for _ in range(200):
+            Product.update_product(2, quantity=3)
+            Product.update_product(2, quantity=4)
+        self.assertLessEqual(len(Product.inventory._low_stock), 64)
+        self.assertEqual([p.name for p in Product.inventory.low_stock()], ["Mouse"])
+
+
+if __name__ == "__main__":
+    unittest.main()
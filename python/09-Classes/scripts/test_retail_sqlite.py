@@ -0,0 +1,157 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from retail_ims import Catalog, Order, Product, process_orders
+from retail_sqlite import SQLiteCatalog
+
+
+class TestSQLiteCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "shop.db")
+        Product.inventory = SQLiteCatalog(self.path)
+
+    def tearDown(self):
+        Product.inventory.close()
+        Product.inventory = Catalog()
+        shutil.rmtree(self.folder)
+
+    def reopen(self):
+        Product.inventory.close()
+        Product.inventory = SQLiteCatalog(self.path)
+        return Product.inventory
+
+    def test_classmethods_persist_across_restart(self):
+        Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+        Product.add_product("Mouse", "Electronics", 200, 25, "Supplier B")
+        Product.update_product(1, quantity=45, supplier="Supplier C")
+        Product.delete_product(2)
+
+        catalog = self.reopen()
+        self.assertEqual(len(catalog), 1)
+        laptop = catalog.get(1)
+        self.assertEqual((laptop.quantity, laptop.supplier, laptop.version), (45, "Supplier C", 1))
+        self.assertIsNone(catalog.get(2))
+
+        # Ids keep counting up after a restart
+        Product.add_product("Desk", "Furniture", 10, 300, "Supplier A")
+        self.assertEqual(catalog.get(3).name, "Desk")
+
+    def test_lazy_loading_returns_the_same_object(self):
+        Product.inventory.bulk_upsert([(1, "Laptop", "Electronics", 50, 1000, "Supplier A")])
+        catalog = self.reopen()
+        self.assertEqual(catalog._products, {})
+        self.assertIs(catalog.get(1), catalog.get(1))
+        self.assertIs(catalog.by_category("Electronics")[0], catalog.get(1))
+
+    def test_bulk_upsert_refuses_stale_versions(self):
+        Product.inventory.bulk_upsert([(1, "Laptop", "Electronics", 50, 1000, "Supplier A")])
+        laptop = Product.inventory.get(1)
+        Product.update_product(1, quantity=48)
+        Product.update_product(1, quantity=47)
+        self.assertEqual(laptop.version, 2)
+
+        read_version = laptop.version
+        Product.inventory.bulk_upsert([(1, "Laptop", "Electronics", 7, 1000, "Supplier A")])
+        self.assertEqual(laptop.version, 3)
+        self.assertEqual(
+            Product.update_product(1, quantity=49, expected_version=read_version),
+            "Product was changed by someone else, please reload it",
+        )
+        self.assertEqual(laptop.quantity, 7)
+
+        catalog = self.reopen()
+        self.assertEqual((catalog.get(1).quantity, catalog.get(1).version), (7, 3))
+
+    def test_update_never_writes_an_older_row(self):
+        Product.add_product("Laptop", "Electronics", 50, 1000, "Supplier A")
+        catalog = Product.inventory
+        real_write = catalog._write
+        racer = threading.Thread(target=lambda: Order(1, [(1, 5)]).place())
+
+        def order_races_the_write(sql, rows):
+            # Another thread sells 5 just as the update is about to save the product
+            if not racer.is_alive() and racer.ident is None:
+                racer.start()
+                racer.join(0.2)
+            real_write(sql, rows)
+
+        with mock.patch.object(catalog, "_write", order_races_the_write):
+            Product.update_product(1, quantity=40)
+            racer.join()
+
+        laptop = catalog.get(1)
+        self.assertEqual((laptop.quantity, laptop.version), (35, 2))
+        catalog = self.reopen()
+        self.assertEqual((catalog.get(1).quantity, catalog.get(1).version), (35, 2))
+
+    def test_bulk_upsert_and_indexes(self):
+        rows = [(i, f"Product {i}", "Even" if i % 2 == 0 else "Odd", 10, 5.0, "Supplier A") for i in range(1, 101)]
+        self.assertEqual(Product.inventory.bulk_upsert(rows), 100)
+        laptop = Product.inventory.get(2)
+        Product.inventory.bulk_upsert([(2, "Product 2", "Even", 99, 5.0, "Supplier B")])
+
+        self.assertEqual(laptop.quantity, 99)
+        self.assertEqual(len(Product.inventory.by_category("Even")), 50)
+        self.assertEqual([p.product_id for p in Product.inventory.by_supplier("Supplier B")], [2])
+
+    def test_orders_and_stock_are_saved(self):
+        Product.add_product("Laptop", "Electronics", 5, 1000, "Supplier A")
+        orders = [Order(1, [(1, 3)], "John"), Order(2, [(1, 3)], "Jane")]
+        report = process_orders(orders)
+        self.assertEqual(report.placed, 1)
+        Product.inventory.save_orders(orders)
+
+        catalog = self.reopen()
+        self.assertEqual(catalog.get(1).quantity, 2)
+        order = catalog.load_order(2)
+        self.assertEqual((order.products, order.customer_info, order.status), ([(1, 3)], "Jane", "rejected"))
+        self.assertIsNone(catalog.load_order(3))
+
+    def test_totals_survive_restart_and_bulk_load(self):
+        Product.inventory.bulk_upsert([
+            (1, "Laptop", "Electronics", 10, 1000, "Supplier A"),
+            (2, "Mouse", "Electronics", 3, 25, "Supplier B"),
+        ])
+        Order(1, [(1, 9)]).place()
+
+        catalog = self.reopen()
+        self.assertEqual(catalog.total_value, 1000 + 75)
+        self.assertEqual(catalog.category_quantity, {"Electronics": 4})
+        self.assertEqual([(p.name, p.quantity) for p in catalog.low_stock()], [("Laptop", 1), ("Mouse", 3)])
+
+        Product.update_product(2, price=30)
+        self.assertEqual(catalog.total_value, 1000 + 90)
+
+    def test_bulk_load_moves_totals_by_the_difference(self):
+        Product.inventory.bulk_upsert([
+            (1, "Laptop", "Electronics", 10, 1000, "Supplier A"),
+            (2, "Mouse", "Electronics", 3, 25, "Supplier B"),
+            (3, "Desk", "Furniture", 2, 300, "Supplier A"),
+        ])
+        catalog = self.reopen()
+        catalog.get(1)  # one replaced product in memory, the others only on disk
+
+        with mock.patch.object(catalog, "_load_totals", side_effect=AssertionError("full recompute")):
+            catalog.bulk_upsert([
+                (1, "Laptop", "Computers", 8, 900, "Supplier C"),
+                (2, "Mouse", "Electronics", 5, 25, "Supplier B"),
+                (4, "Chair", "Furniture", 4, 50, "Supplier A"),
+                (2, "Mouse", "Electronics", 6, 20, "Supplier B"),  # the later row wins
+            ])
+
+        dashboard = catalog.dashboard()
+        reopened = self.reopen().dashboard()
+        self.assertEqual(dashboard, reopened)
+        self.assertEqual(dashboard["total_value"], 8 * 900 + 6 * 20 + 2 * 300 + 4 * 50)
+        self.assertEqual(dashboard["category_quantity"], {"Electronics": 6, "Furniture": 6, "Computers": 8})
+        self.assertEqual(dashboard["supplier_quantity"], {"Supplier A": 6, "Supplier B": 6, "Supplier C": 8})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Compressed Sparse Row (CSR) graph.
+# The dictionary format from bfs.py stores one Python list per person, which costs a lot of memory.
+# CSR stores the whole graph in two flat integer arrays instead:
+# - targets: every neighbor of node 0, then every neighbor of node 1, and so on
+# - offsets: node i's neighbors live in targets[offsets[i]:offsets[i + 1]]
+# Node labels (names) are kept in a separate list, and the arrays only ever hold integer ids.
+import numpy as np
+
+
+def slice_positions(starts, counts):
+    # starts[0], starts[0] + 1, ... (counts[0] of them), then the same for starts[1], and so on:
+    # the positions of several CSR rows at once, e.g. targets[slice_positions(...)] without a loop
+    total = int(counts.sum())
+    block_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(total) - block_starts + np.repeat(starts, counts)
+
+
+class CSRGraph:
+    def __init__(self, offsets, targets, labels):
+        self.offsets = offsets
+        self.targets = targets
+        self.labels = labels
+        self._index = None
+        self._reverse = None
+
+    def __len__(self):
+        return self.num_nodes
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    @property
+    def index(self):
+        # label -> node id, built on first use so loading a graph stays cheap
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index
+
+    def neighbors(self, node_id):
+        # A zero-copy slice of the targets array
+        return self.targets[self.offsets[node_id] : self.offsets[node_id + 1]]
+
+    def get(self, node, default=None):
+        # Behaves like the dictionary in bfs.py, so breadth_first_search(graph, ...) works unchanged
+        node_id = self.index.get(node)
+        if node_id is None:
+            return default
+        return [self.labels[target] for target in self.neighbors(node_id)]
+
+    @property
+    def ids(self):
+        # The same graph addressed by integer node id, for traversals that should skip label lookups
+        return IdView(self)
+
+    def to_dict(self):
+        # Back to the dictionary format used in bfs.py / dfs.py
+        return {
+            label: [self.labels[target] for target in self.neighbors(i)]
+            for i, label in enumerate(self.labels)
+        }
+
+    def reverse(self):
+        # The same graph with every edge flipped (who points at me instead of who I point at).
+        # Built on first use and kept, since the arrays never change after construction.
+        if self._reverse is None:
+            sources = np.repeat(np.arange(self.num_nodes, dtype=self.targets.dtype), np.diff(self.offsets))
+            self._reverse = CSRGraph.from_edges(self.targets, sources, self.labels)
+        return self._reverse
+
+    @classmethod
+    def from_edges(cls, sources, targets, labels, dedupe=False):
+        # Build CSR from parallel arrays of integer (source, target) pairs.
+        # A stable sort by source groups each node's neighbors together.
+        num_nodes = len(labels)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+
+        if dedupe:
+            # Sort-unique pass: pack each pair into one integer, then let np.unique drop repeats
+            packed = np.unique(sources * num_nodes + targets)
+            sources, targets = np.divmod(packed, num_nodes)
+        else:
+            order = np.argsort(sources, kind="stable")
+            sources = sources[order]
+            targets = targets[order]
+
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+
+        return cls(offsets, targets.astype(np.int32), list(labels))
+
+    @classmethod
+    def from_dict(cls, graph):
+        index = {}
+        for node, neighbors in graph.items():
+            index.setdefault(node, len(index))
+            for neighbor in neighbors:
+                index.setdefault(neighbor, len(index))
+
+        sources = []
+        targets = []
+        for node, neighbors in graph.items():
+            for neighbor in neighbors:
+                sources.append(index[node])
+                targets.append(index[neighbor])
+
+        return cls.from_edges(sources, targets, list(index), dedupe=True)
+
+
+class IdView:
+    # A dictionary-like view where node ids map straight to zero-copy slices of the targets array.
+    # breadth_first_search(graph.ids, start_id, target_id) then never touches a label.
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __len__(self):
+        return self.graph.num_nodes
+
+    def get(self, node_id, default=None):
+        if 0 <= node_id < self.graph.num_nodes:
+            return self.graph.neighbors(node_id)
+        return default
@@ -0,0 +1,157 @@
+# Build a graph from a CSV file one row at a time.
+# pandas.read_csv (or list(csv.reader(...))) pulls the whole file into memory first.
+# Here we stream rows, keep only what the graph needs (an integer id per distinct node
+# and one entry per distinct edge), and throw each row away as soon as it is read.
+# Memory therefore grows with the size of the graph, not with the size of the file.
+import csv
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+SEEDS_DIR = Path(__file__).resolve().parents[3] / "dbt" / "Projects" / "looker_ecommerce" / "seeds"
+
+
+def stream_edges(path, source_column, target_column, source_prefix="", target_prefix=""):
+    # Yield (source, target) label pairs, skipping rows where either end is missing (including
+    # short or blank rows). Prefixes keep different kinds of node apart (user 42 and product 42
+    # are not the same node).
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        missing = [column for column in (source_column, target_column) if column not in header]
+        if missing:
+            raise ValueError(f"{path} has no column {', '.join(missing)}")
+        source_at = header.index(source_column)
+        target_at = header.index(target_column)
+        width = max(source_at, target_at) + 1
+
+        for row in reader:
+            if len(row) < width:
+                continue
+            source = row[source_at]
+            target = row[target_at]
+            if source and target:
+                yield source_prefix + source, target_prefix + target
+
+
+class EdgeListBuilder:
+    def __init__(self, dedupe="hash", undirected=False, compact_every=1_000_000):
+        # dedupe="hash": remember every edge in a set, drop repeats as they arrive.
+        # dedupe="sort": append to a packed array and run a sort-unique pass every so often,
+        # which uses far less memory per edge than a set of Python ints.
+        if dedupe not in ("hash", "sort"):
+            raise ValueError("dedupe must be 'hash' or 'sort'")
+
+        self.dedupe = dedupe
+        self.undirected = undirected
+        self.compact_every = compact_every
+
+        self.index = {}
+        self.labels = []
+
+        self._seen = set()
+        self._sources = array("q")
+        self._targets = array("q")
+        self._packed = array("q")
+        self._unique_packed = np.zeros(0, dtype=np.int64)
+
+    @property
+    def num_nodes(self):
+        return len(self.labels)
+
+    def intern(self, label):
+        # Give every distinct label a small integer id, the first time we see it
+        node_id = self.index.get(label)
+        if node_id is None:
+            node_id = len(self.labels)
+            self.index[label] = node_id
+            self.labels.append(label)
+        return node_id
+
+    def add_edge(self, source, target):
+        source_id = self.intern(source)
+        target_id = self.intern(target)
+        self._add(source_id, target_id)
+        if self.undirected and source_id != target_id:
+            self._add(target_id, source_id)
+
+    def add_edges(self, edges):
+        for source, target in edges:
+            self.add_edge(source, target)
+        return self
+
+    def _add(self, source_id, target_id):
+        # Node ids fit in 32 bits, so a pair packs into a single 64-bit integer
+        key = (source_id << 32) | target_id
+
+        if self.dedupe == "hash":
+            if key not in self._seen:
+                self._seen.add(key)
+                self._sources.append(source_id)
+                self._targets.append(target_id)
+        else:
+            self._packed.append(key)
+            if len(self._packed) >= self.compact_every:
+                self._compact()
+
+    def _compact(self):
+        # Merge the pending keys into the sorted unique set and drop the duplicates
+        pending = np.frombuffer(self._packed, dtype=np.int64)
+        self._unique_packed = np.unique(np.concatenate([self._unique_packed, pending]))
+        self._packed = array("q")
+
+    def _edge_arrays(self):
+        if self.dedupe == "hash":
+            return (
+                np.frombuffer(self._sources, dtype=np.int64),
+                np.frombuffer(self._targets, dtype=np.int64),
+            )
+
+        self._compact()
+        return self._unique_packed >> 32, self._unique_packed & 0xFFFFFFFF
+
+    def to_csr(self):
+        sources, targets = self._edge_arrays()
+        return CSRGraph.from_edges(sources, targets, self.labels)
+
+    def to_dict(self):
+        # The dictionary format used in bfs.py / dfs.py. Every node gets a key, even with no neighbors.
+        graph = {label: [] for label in self.labels}
+        sources, targets = self._edge_arrays()
+        for source_id, target_id in zip(sources.tolist(), targets.tolist()):
+            graph[self.labels[source_id]].append(self.labels[target_id])
+        return graph
+
+
+def load_graph(path, source_column, target_column, source_prefix="", target_prefix="",
+               dedupe="hash", undirected=False, as_csr=True):
+    builder = EdgeListBuilder(dedupe=dedupe, undirected=undirected)
+    builder.add_edges(
+        stream_edges(path, source_column, target_column, source_prefix, target_prefix)
+    )
+    return builder.to_csr() if as_csr else builder.to_dict()
+
+
+def load_user_sessions(seeds_dir=SEEDS_DIR, **kwargs):
+    # user -> session, from the Looker e-commerce events seed
+    return load_graph(
+        Path(seeds_dir) / "events.csv", "user_id", "session_id", "user:", "session:", **kwargs
+    )
+
+
+def load_user_products(seeds_dir=SEEDS_DIR, **kwargs):
+    # user -> product they ordered, from the Looker e-commerce order items seed
+    return load_graph(
+        Path(seeds_dir) / "order_items.csv", "user_id", "product_id", "user:", "product:", **kwargs
+    )
+
+
+if __name__ == "__main__":
+    sessions = load_user_sessions()
+    print(f"user -> session: {sessions.num_nodes} nodes, {sessions.num_edges} edges")
+
+    purchases = load_user_products(dedupe="sort")
+    print(f"user -> product: {purchases.num_nodes} nodes, {purchases.num_edges} edges")
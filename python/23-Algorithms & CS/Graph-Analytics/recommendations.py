@@ -0,0 +1,156 @@
+# "People you may know": rank the friends-of-friends by how many friends they share with us.
+# The obvious version builds a Python set of every friend-of-a-friend and intersects sets one by one.
+# Through a hub (someone with a million friends) that means millions of set operations per query.
+#
+# Instead every person's friend list is stored as a compressed bitset: the node ids are split into
+# blocks of 64, and for each block that holds at least one friend we keep the block id and one
+# uint64 "word" whose bits say which of those 64 people are friends. Counting mutual friends is
+# then "AND the words of matching blocks, count the 1 bits" (popcount) for a whole batch of
+# candidates in a few NumPy calls. Empty blocks are never stored, like the containers in a
+# Roaring bitmap, so sparse friend lists stay small.
+import numpy as np
+
+from csr_graph import CSRGraph, slice_positions
+
+BLOCK_BITS = 64
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:
+    # Older NumPy: count the bits of each byte with a lookup table and add them up
+    _BYTE_BITS = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+    def _popcount(words):
+        as_bytes = words.view(np.uint8).reshape(-1, 8)
+        return _BYTE_BITS[as_bytes].sum(axis=1)
+
+
+class FriendBitsets:
+    def __init__(self, graph):
+        # graph is a CSRGraph; every node's friends become (block id, 64-bit word) pairs
+        self.graph = graph
+        num_nodes = graph.num_nodes
+
+        sources = np.repeat(np.arange(num_nodes, dtype=np.int64), np.diff(graph.offsets))
+        targets = np.asarray(graph.targets, dtype=np.int64)
+
+        # One key per (person, block); np.unique sorts them so each person's blocks are contiguous
+        num_blocks = num_nodes // BLOCK_BITS + 1
+        keys, slot = np.unique(sources * num_blocks + targets // BLOCK_BITS, return_inverse=True)
+
+        self.words = np.zeros(len(keys), dtype=np.uint64)
+        bits = np.left_shift(np.uint64(1), (targets % BLOCK_BITS).astype(np.uint64))
+        np.bitwise_or.at(self.words, slot, bits)
+
+        owners = keys // num_blocks
+        self.block_ids = keys % num_blocks
+        self.block_offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owners, minlength=num_nodes), out=self.block_offsets[1:])
+
+    @classmethod
+    def from_graph(cls, graph, undirected=True):
+        # Accepts the bfs.py dictionary or a CSRGraph. Friendship goes both ways by default,
+        # so "You -> Alice" also makes You one of Alice's friends.
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+
+        if undirected:
+            sources = np.repeat(np.arange(graph.num_nodes), np.diff(graph.offsets))
+            targets = np.asarray(graph.targets, dtype=np.int64)
+            keep = sources != targets
+            graph = CSRGraph.from_edges(
+                np.concatenate([sources[keep], targets[keep]]),
+                np.concatenate([targets[keep], sources[keep]]),
+                graph.labels,
+                dedupe=True,
+            )
+        return cls(graph)
+
+    def _blocks(self, node_id):
+        start, end = self.block_offsets[node_id], self.block_offsets[node_id + 1]
+        return self.block_ids[start:end], self.words[start:end]
+
+    def mutual_count(self, a, b):
+        # Number of friends a and b share, for one candidate pair of node ids
+        ids_a, words_a = self._blocks(a)
+        ids_b, words_b = self._blocks(b)
+        _, at_a, at_b = np.intersect1d(ids_a, ids_b, assume_unique=True, return_indices=True)
+        return int(_popcount(words_a[at_a] & words_b[at_b]).sum())
+
+    def mutual_counts(self, node_id, candidates):
+        # Mutual friend counts between node_id and every candidate, in one vectorised pass
+        candidates = np.asarray(candidates, dtype=np.int64)
+        my_ids, my_words = self._blocks(node_id)
+        if len(candidates) == 0 or len(my_ids) == 0:
+            return np.zeros(len(candidates), dtype=np.int64)
+
+        # Every block of every candidate, and which candidate it belongs to
+        starts = self.block_offsets[candidates]
+        counts = self.block_offsets[candidates + 1] - starts
+        block_positions = slice_positions(starts, counts)
+        owner = np.repeat(np.arange(len(candidates)), counts)
+        their_ids = self.block_ids[block_positions]
+
+        # Find each candidate block among my (sorted) blocks; only exact matches can share friends
+        where = np.searchsorted(my_ids, their_ids)
+        where[where == len(my_ids)] = 0
+        match = my_ids[where] == their_ids
+
+        shared_bits = _popcount(my_words[where[match]] & self.words[block_positions[match]])
+        return np.bincount(owner[match], weights=shared_bits, minlength=len(candidates)).astype(np.int64)
+
+    def friends(self, node_id):
+        return self.graph.neighbors(node_id)
+
+    def candidates(self, node_id):
+        # Friends-of-friends, minus me and the people I already know
+        friends = np.asarray(self.friends(node_id), dtype=np.int64)
+        starts = self.graph.offsets[friends]
+        positions = slice_positions(starts, self.graph.offsets[friends + 1] - starts)
+        two_hop = np.unique(self.graph.targets[positions].astype(np.int64))
+        known = np.append(friends, node_id)
+        return two_hop[~np.isin(two_hop, known)]
+
+    def recommend(self, node_id, k=10):
+        # The top k candidates by mutual friends, ties broken by node id
+        candidates = self.candidates(node_id)
+        if len(candidates) == 0 or k <= 0:
+            return []
+
+        counts = self.mutual_counts(node_id, candidates)
+        if len(candidates) > k:
+            # argpartition finds the k-th largest count without sorting everyone.
+            # Everyone above it is in; ties at the cut go to the smallest ids (candidates are sorted).
+            threshold = counts[np.argpartition(-counts, k - 1)[k - 1]]
+            above = np.flatnonzero(counts > threshold)
+            tied = np.flatnonzero(counts == threshold)[: k - len(above)]
+            top = np.concatenate([above, tied])
+            candidates, counts = candidates[top], counts[top]
+
+        order = np.lexsort((candidates, -counts))
+        return [(int(candidates[i]), int(counts[i])) for i in order]
+
+
+def people_you_may_know(graph, person, k=10, bitsets=None):
+    # Label-in, labels-out wrapper around FriendBitsets.recommend for the bfs.py dictionary format
+    bitsets = bitsets or FriendBitsets.from_graph(graph)
+    node_id = bitsets.graph.index.get(person)
+    if node_id is None:
+        return []
+
+    labels = bitsets.graph.labels
+    return [(labels[candidate], mutual) for candidate, mutual in bitsets.recommend(node_id, k)]
+
+
+if __name__ == "__main__":
+    social_network = {
+        "You": ["Alice", "Bob"],
+        "Alice": ["Charlie"],
+        "Bob": ["Charlie", "Dave"],
+        "Charlie": ["Eve"],
+        "Dave": [],
+        "Eve": [],
+    }
+
+    for person, mutual in people_you_may_know(social_network, "You", k=3):
+        print(f"{person}: {mutual} mutual friend(s)")
@@ -0,0 +1,48 @@
+import unittest
+
+from csr_graph import CSRGraph
+
+
+class TestCSRGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.social_network = {
+            "You": ["Alice", "Bob"],
+            "Alice": ["Charlie"],
+            "Bob": ["Charlie", "Dave", "Dave"],
+            "Charlie": ["Eve"],
+            "Dave": [],
+        }
+        self.graph = CSRGraph.from_dict(self.social_network)
+
+    def test_neighbors_and_labels(self):
+        self.assertEqual((self.graph.num_nodes, self.graph.num_edges), (6, 6))
+        self.assertEqual(self.graph.labels, ["You", "Alice", "Bob", "Charlie", "Dave", "Eve"])
+        bob = self.graph.index["Bob"]
+        self.assertEqual([self.graph.labels[i] for i in self.graph.neighbors(bob)], ["Charlie", "Dave"])
+        self.assertEqual(len(self.graph.neighbors(self.graph.index["Eve"])), 0)
+
+    def test_dictionary_views(self):
+        self.assertEqual(self.graph.get("You"), ["Alice", "Bob"])
+        self.assertEqual(self.graph.get("Eve"), [])
+        self.assertIsNone(self.graph.get("Zed"))
+        self.assertEqual(self.graph.ids.get(0).tolist(), [1, 2])
+        self.assertIsNone(self.graph.ids.get(6))
+        self.assertEqual(self.graph.to_dict()["Bob"], ["Charlie", "Dave"])
+        self.assertEqual(self.graph.to_dict()["Eve"], [])
+
+    def test_from_edges_groups_by_source(self):
+        graph = CSRGraph.from_edges([2, 0, 2, 0], [1, 2, 0, 1], ["a", "b", "c"])
+        self.assertEqual(graph.offsets.tolist(), [0, 2, 2, 4])
+        self.assertEqual(graph.neighbors(0).tolist(), [2, 1])  # stable: file order is kept
+        self.assertEqual(graph.neighbors(2).tolist(), [1, 0])
+
+    def test_reverse(self):
+        reverse = self.graph.reverse()
+        self.assertEqual(sorted(reverse.get("Charlie")), ["Alice", "Bob"])
+        self.assertEqual(reverse.get("You"), [])
+        self.assertEqual(reverse.num_edges, self.graph.num_edges)
+
+
+if __name__ == "__main__":
+    unittest.main()
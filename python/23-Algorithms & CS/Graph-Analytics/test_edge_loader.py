@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from edge_loader import EdgeListBuilder, load_graph, stream_edges
+
+
+class TestEdgeLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "orders.csv")
+        with open(self.path, "w", newline="") as file:
+            file.write(
+                "id,user_id,product_id\n"
+                "1,7,100\n"
+                "2,7,100\n"  # repeat of the edge above
+                "3,,101\n"  # no user
+                "4,8\n"  # short row
+                "\n"
+                "5,8,101\n"
+                "6,7,101\n"
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_stream_skips_malformed_rows(self):
+        edges = list(stream_edges(self.path, "user_id", "product_id", "user:", "product:"))
+        self.assertEqual(edges, [
+            ("user:7", "product:100"),
+            ("user:7", "product:100"),
+            ("user:8", "product:101"),
+            ("user:7", "product:101"),
+        ])
+
+    def test_missing_column_or_empty_file(self):
+        with self.assertRaisesRegex(ValueError, "buyer"):
+            list(stream_edges(self.path, "buyer", "product_id"))
+
+        empty = os.path.join(self.folder, "empty.csv")
+        open(empty, "w").close()
+        with self.assertRaises(ValueError):
+            list(stream_edges(empty, "user_id", "product_id"))
+
+    def test_both_dedupe_modes_build_the_same_graph(self):
+        graphs = [
+            load_graph(self.path, "user_id", "product_id", "user:", "product:", dedupe=dedupe, as_csr=False)
+            for dedupe in ("hash", "sort")
+        ]
+        expected = {
+            "user:7": ["product:100", "product:101"],
+            "product:100": [],
+            "user:8": ["product:101"],
+            "product:101": [],
+        }
+        for graph in graphs:
+            self.assertEqual({node: sorted(neighbors) for node, neighbors in graph.items()}, expected)
+
+    def test_undirected_and_compaction(self):
+        builder = EdgeListBuilder(dedupe="sort", undirected=True, compact_every=2)
+        builder.add_edges([("a", "b"), ("b", "a"), ("a", "a"), ("a", "b")])
+        graph = builder.to_csr()
+        self.assertEqual(graph.num_edges, 3)  # a-b both ways, plus the self-loop once
+        self.assertEqual(sorted(graph.get("a")), ["a", "b"])
+        self.assertEqual(graph.get("b"), ["a"])
+
+    def test_bad_dedupe_mode(self):
+        with self.assertRaises(ValueError):
+            EdgeListBuilder(dedupe="bloom")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from graph_analytics import analyse, degree_distribution, degrees, friends_of_friends, pagerank, to_sparse
+
+
+class TestGraphAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        self.social_network = {
+            "You": ["Alice", "Bob"],
+            "Alice": ["Charlie"],
+            "Bob": ["Charlie", "Dave", "Dave"],  # a repeated edge counts once
+            "Charlie": ["Eve"],
+            "Dave": [],
+        }
+
+    def test_to_sparse_interns_neighbors_and_drops_repeats(self):
+        matrix, labels = to_sparse(self.social_network)
+        self.assertEqual(labels, ["You", "Alice", "Bob", "Charlie", "Dave", "Eve"])
+        self.assertEqual(matrix.shape, (6, 6))
+        self.assertEqual(matrix.nnz, 6)
+        self.assertEqual(set(matrix.data), {1.0})
+        self.assertEqual(matrix[2].indices.tolist(), [3, 4])  # Bob -> Charlie, Dave
+
+    def test_pagerank_matches_hand_computed_graph(self):
+        # A -> B, and B points nowhere, so B shares its score with everyone:
+        #   a = 0.15 / 2 + 0.85 * b / 2,  a + b = 1  =>  a = 0.5 / 1.425
+        matrix, _ = to_sparse({"A": ["B"], "B": []})
+        ranks = pagerank(matrix)
+        np.testing.assert_allclose(ranks, [0.5 / 1.425, 1 - 0.5 / 1.425])
+
+        cycle, _ = to_sparse({"A": ["B"], "B": ["C"], "C": ["A"]})
+        np.testing.assert_allclose(pagerank(cycle), [1 / 3] * 3)
+
+    def test_pagerank_sums_to_one(self):
+        rng = np.random.default_rng(0)
+        graph = CSRGraph.from_edges(rng.integers(0, 500, 3_000), rng.integers(0, 500, 3_000), range(500))
+        matrix, _ = to_sparse(graph.to_dict())
+        ranks = pagerank(matrix)
+        self.assertAlmostEqual(ranks.sum(), 1.0)
+        self.assertTrue((ranks > 0).all())
+        self.assertEqual(len(pagerank(to_sparse({})[0])), 0)
+
+    def test_degrees_and_friends_of_friends(self):
+        matrix, _ = to_sparse(self.social_network)
+        in_degree, out_degree = degrees(matrix)
+        self.assertEqual(in_degree.tolist(), [0, 1, 1, 2, 1, 1])
+        self.assertEqual(out_degree.tolist(), [2, 1, 2, 1, 0, 0])
+        self.assertEqual(friends_of_friends(matrix).tolist(), [2, 1, 1, 0, 0, 0])
+
+        in_distribution, out_distribution = degree_distribution(matrix)
+        self.assertEqual(in_distribution.tolist(), [1, 4, 1])
+        self.assertEqual(out_distribution.tolist(), [2, 2, 2])
+
+    def test_analyse_is_keyed_by_label(self):
+        stats = analyse(self.social_network)
+        self.assertEqual(stats["You"]["friends_of_friends"], 2)
+        self.assertEqual(stats["Charlie"]["in_degree"], 2)
+        self.assertAlmostEqual(sum(person["pagerank"] for person in stats.values()), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
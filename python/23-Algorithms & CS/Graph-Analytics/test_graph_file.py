@@ -0,0 +1,110 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from graph_file import HEADER, MAGIC, GraphFile, open_graph_file, write_graph_file
+
+
+class TestGraphFile(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "network.graph")
+        self.graph = CSRGraph.from_dict({
+            "You": ["Alice", "Bob"],
+            "Alice": ["Charlie"],
+            "Bob": ["Charlie", "Dave"],
+            "Charlie": ["Zoë"],
+            "Dave": [],
+            "Zoë": [],
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_round_trip(self):
+        write_graph_file(self.graph, self.path)
+
+        with open_graph_file(self.path) as mapped:
+            self.assertIsInstance(mapped, GraphFile)
+            self.assertEqual((mapped.num_nodes, mapped.num_edges), (self.graph.num_nodes, self.graph.num_edges))
+            np.testing.assert_array_equal(mapped.offsets, self.graph.offsets)
+            np.testing.assert_array_equal(mapped.targets, self.graph.targets)
+            self.assertEqual(list(mapped.labels), self.graph.labels)
+            self.assertEqual(mapped.get("Charlie"), ["Zoë"])
+            self.assertEqual(mapped.to_dict(), self.graph.to_dict())
+
+    def test_arrays_are_read_only(self):
+        write_graph_file(self.graph, self.path)
+
+        with open_graph_file(self.path) as mapped:
+            with self.assertRaises(ValueError):
+                mapped.targets[0] = 1
+
+    def test_labels_come_back_as_text(self):
+        graph = CSRGraph.from_edges([0, 1], [1, 2], [10, 20, 30])
+        write_graph_file(graph, self.path)
+
+        with open_graph_file(self.path) as mapped:
+            self.assertEqual(list(mapped.labels), ["10", "20", "30"])
+            with self.assertRaises(IndexError):
+                mapped.labels[3]
+
+    def test_empty_graph(self):
+        write_graph_file(CSRGraph.from_edges([], [], []), self.path)
+
+        with open_graph_file(self.path) as mapped:
+            self.assertEqual((mapped.num_nodes, mapped.num_edges), (0, 0))
+
+    def test_views_may_outlive_the_file(self):
+        write_graph_file(self.graph, self.path)
+
+        with open_graph_file(self.path) as mapped:
+            neighbors = mapped.neighbors(0)
+            offsets = mapped.offsets
+        self.assertEqual(neighbors.tolist(), self.graph.neighbors(0).tolist())
+        self.assertEqual(offsets.tolist(), self.graph.offsets.tolist())
+
+    def test_empty_and_truncated_files_are_rejected(self):
+        write_graph_file(self.graph, self.path)
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        for length in (0, 10, len(data) - 1):
+            with open(self.path, "wb") as file:
+                file.write(data[:length])
+            with self.assertRaises(ValueError):
+                open_graph_file(self.path)
+
+    def test_wrong_magic_is_rejected(self):
+        write_graph_file(self.graph, self.path)
+        with open(self.path, "r+b") as file:
+            file.write(b"NOTGRAPH")
+
+        with self.assertRaises(ValueError):
+            open_graph_file(self.path)
+
+    def test_unknown_version_is_rejected(self):
+        write_graph_file(self.graph, self.path)
+        with open(self.path, "r+b") as file:
+            file.seek(len(MAGIC))
+            file.write(struct.pack("<I", 99))
+
+        with self.assertRaisesRegex(ValueError, "version 99"):
+            open_graph_file(self.path)
+
+    def test_header_records_sizes(self):
+        write_graph_file(self.graph, self.path)
+        with open(self.path, "rb") as file:
+            magic, _, _, num_nodes, num_edges, _ = HEADER.unpack(file.read(HEADER.size))
+
+        self.assertEqual((magic, num_nodes, num_edges), (MAGIC, 6, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from collections import deque
+from unittest import mock
+
+import numpy as np
+
+import parallel_bfs
+from csr_graph import CSRGraph
+from parallel_bfs import parallel_bfs as run_bfs, parallel_breadth_first_search
+
+
+def plain_bfs(graph, start_id):
+    # One node at a time off a deque: the distances every parallel run must reproduce
+    distance = [-1] * graph.num_nodes
+    distance[start_id] = 0
+    queue = deque([start_id])
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph.neighbors(node):
+            if distance[neighbor] == -1:
+                distance[neighbor] = distance[node] + 1
+                queue.append(neighbor)
+    return np.array(distance)
+
+
+def random_graph(num_nodes=2_000, num_edges=16_000, seed=0, undirected=False):
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(0, num_nodes, num_edges)
+    targets = rng.integers(0, num_nodes, num_edges)
+    if undirected:
+        sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+    return CSRGraph.from_edges(sources, targets, range(num_nodes))
+
+
+class TestParallelBFS(unittest.TestCase):
+
+    def assertMatchesPlainBFS(self, graph, start_id, **options):
+        result = run_bfs(graph, start_id, **options)
+        np.testing.assert_array_equal(result.distance, plain_bfs(graph, start_id))
+
+        # Every parent is one step closer to the start and really points at its child
+        for node in np.flatnonzero(result.distance > 0):
+            parent = result.parent[node]
+            self.assertEqual(result.distance[parent], result.distance[node] - 1)
+            self.assertIn(node, graph.neighbors(parent))
+        self.assertTrue((result.parent[result.distance == -1] == -1).all())
+        return result
+
+    def test_single_process_matches_plain_bfs(self):
+        graph = random_graph()
+        for direction_optimizing in (True, False):
+            self.assertMatchesPlainBFS(graph, 0, processes=1, direction_optimizing=direction_optimizing)
+
+    def test_worker_processes_match_plain_bfs(self):
+        graph = random_graph()
+        with mock.patch.object(parallel_bfs, "MIN_PARALLEL_WORK", 0):
+            self.assertMatchesPlainBFS(graph, 0, processes=2)
+            self.assertMatchesPlainBFS(graph, 5, processes=2, direction_optimizing=False)
+
+    def test_undirected_graph_uses_forward_edges_for_bottom_up(self):
+        graph = random_graph(undirected=True)
+        with mock.patch.object(parallel_bfs, "MIN_PARALLEL_WORK", 0):
+            self.assertMatchesPlainBFS(graph, 0, processes=2, undirected=True)
+
+    def test_bottom_up_handles_high_in_degree(self):
+        # Node 1 is pointed at by everyone, so its parent search runs over many rounds
+        num_nodes = 500
+        sources = np.concatenate([np.zeros(num_nodes - 2), np.arange(2, num_nodes)])
+        targets = np.concatenate([np.arange(2, num_nodes), np.ones(num_nodes - 2)])
+        graph = CSRGraph.from_edges(sources, targets, range(num_nodes))
+        result = self.assertMatchesPlainBFS(graph, 0, processes=1)
+        self.assertEqual(result.distance[1], 2)
+
+    def test_reverse_graph_is_built_once(self):
+        graph = random_graph()
+        self.assertIs(graph.reverse(), graph.reverse())
+
+    def test_path_to(self):
+        social_network = {
+            "You": ["Alice", "Bob"],
+            "Alice": ["Charlie"],
+            "Bob": ["Charlie", "Dave"],
+            "Charlie": ["Eve"],
+            "Dave": [],
+            "Eve": [],
+        }
+        self.assertEqual(
+            parallel_breadth_first_search(social_network, "You", "Eve", processes=1),
+            ["You", "Alice", "Charlie", "Eve"],
+        )
+        self.assertIsNone(parallel_breadth_first_search(social_network, "Eve", "You", processes=1))
+        self.assertIsNone(parallel_breadth_first_search(social_network, "You", "Nobody", processes=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from recommendations import FriendBitsets, people_you_may_know
+
+
+def brute_force(friends, node_id, k):
+    # The obvious set-based version: friends-of-friends, ranked by shared friends, then by id
+    mine = friends[node_id]
+    candidates = set().union(*(friends[f] for f in mine)) - mine - {node_id} if mine else set()
+    scored = sorted((-len(mine & friends[c]), c) for c in candidates)
+    return [(c, -negative) for negative, c in scored[:k]]
+
+
+class TestRecommendations(unittest.TestCase):
+
+    def setUp(self):
+        self.social_network = {
+            "You": ["Alice", "Bob"],
+            "Alice": ["Charlie"],
+            "Bob": ["Charlie", "Dave"],
+            "Charlie": ["Eve"],
+            "Dave": [],
+            "Eve": [],
+        }
+
+        # Random undirected graph with self loops and duplicates, spread over many 64-bit blocks
+        rng = np.random.default_rng(0)
+        num_nodes = 300
+        sources = rng.integers(0, num_nodes, 3000)
+        targets = rng.integers(0, num_nodes, 3000)
+        graph = CSRGraph.from_edges(sources, targets, [f"n{i}" for i in range(num_nodes)], dedupe=True)
+        self.bitsets = FriendBitsets.from_graph(graph)
+
+        self.friends = [set() for _ in range(num_nodes)]
+        for a, b in zip(sources.tolist(), targets.tolist()):
+            if a != b:
+                self.friends[a].add(b)
+                self.friends[b].add(a)
+
+    def test_people_you_may_know(self):
+        self.assertEqual(people_you_may_know(self.social_network, "You", k=3), [("Charlie", 2), ("Dave", 1)])
+        self.assertEqual(people_you_may_know(self.social_network, "You", k=1), [("Charlie", 2)])
+        self.assertEqual(people_you_may_know(self.social_network, "Nobody"), [])
+
+    def test_matches_brute_force(self):
+        for node_id in range(0, 300, 7):
+            for k in (1, 5, 1000):
+                self.assertEqual(self.bitsets.recommend(node_id, k), brute_force(self.friends, node_id, k))
+
+    def test_candidates(self):
+        for node_id in range(0, 300, 11):
+            mine = self.friends[node_id]
+            expected = set().union(*(self.friends[f] for f in mine)) - mine - {node_id}
+            self.assertEqual(self.bitsets.candidates(node_id).tolist(), sorted(expected))
+
+    def test_mutual_counts_match_mutual_count(self):
+        candidates = np.arange(300)
+        counts = self.bitsets.mutual_counts(5, candidates)
+        expected = [len(self.friends[5] & self.friends[c]) for c in range(300)]
+        self.assertEqual(counts.tolist(), expected)
+        self.assertEqual([self.bitsets.mutual_count(5, c) for c in range(300)], expected)
+
+    def test_no_candidates(self):
+        lonely = FriendBitsets.from_graph({"A": ["B"], "B": [], "C": []})
+        self.assertEqual(lonely.recommend(0), [])
+        self.assertEqual(lonely.recommend(2), [])
+        self.assertEqual(lonely.recommend(0, k=0), [])
+        self.assertEqual(lonely.mutual_counts(0, []).tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
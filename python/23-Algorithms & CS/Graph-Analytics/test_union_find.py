@@ -0,0 +1,55 @@
+import unittest
+
+from union_find import DisjointSet
+
+
+class TestDisjointSet(unittest.TestCase):
+
+    def setUp(self):
+        self.social_network = {
+            "You": ["Alice", "Bob"],
+            "Alice": ["Charlie"],
+            "Bob": ["Charlie", "Dave"],
+            "Charlie": ["Eve"],
+            "Dave": [],
+            "Eve": [],
+            "Frank": ["Grace"],
+            "Grace": [],
+        }
+        self.groups = DisjointSet.from_graph(self.social_network)
+
+    def test_connectivity(self):
+        self.assertTrue(self.groups.connected("You", "Eve"))
+        self.assertTrue(self.groups.connected("Eve", "Dave"))  # edge direction is ignored
+        self.assertFalse(self.groups.connected("You", "Frank"))
+        self.assertEqual(self.groups.find("Eve"), self.groups.find("You"))
+
+    def test_component_sizes(self):
+        self.assertEqual(sorted(self.groups.component_sizes().values()), [2, 6])
+        self.assertEqual(self.groups.component_size("Grace"), 2)
+        self.assertEqual(sorted(map(sorted, self.groups.components().values())), [
+            ["Alice", "Bob", "Charlie", "Dave", "Eve", "You"],
+            ["Frank", "Grace"],
+        ])
+
+    def test_union_reports_whether_groups_merged(self):
+        self.assertTrue(self.groups.union("Eve", "Frank"))
+        self.assertFalse(self.groups.union("Grace", "You"))
+        self.assertEqual(self.groups.component_size("You"), 8)
+
+    def test_unknown_nodes_are_never_created_by_queries(self):
+        self.assertFalse(self.groups.connected("You", "Zed"))
+        self.assertEqual(self.groups.component_size("Zed"), 0)
+        with self.assertRaises(KeyError):
+            self.groups.find("Zed")
+        self.assertNotIn("Zed", self.groups)
+        self.assertEqual(len(self.groups), 8)
+
+    def test_long_chain_does_not_hit_recursion_limit(self):
+        groups = DisjointSet.from_edges((i, i + 1) for i in range(100_000))
+        self.assertTrue(groups.connected(0, 100_000))
+        self.assertEqual(groups.component_size(50_000), 100_001)
+
+
+if __name__ == "__main__":
+    unittest.main()
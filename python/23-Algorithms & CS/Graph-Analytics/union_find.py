@@ -0,0 +1,131 @@
+# A Disjoint-Set (Union-Find) answers "are A and B in the same group?" without walking the graph.
+# Every node points at a parent; following parents leads to the group's representative (the "root").
+# Two tricks keep the trees almost flat, so each query is close to constant time:
+# - Union by size: the smaller tree is always hung under the bigger one.
+# - Path compression: while walking up to the root, nodes are re-pointed closer to it.
+
+
+class DisjointSet:
+    def __init__(self, nodes=()):
+        # Node labels are interned to integer slots, so the hot loops only touch lists of ints
+        self.index = {}
+        self.labels = []
+        self.parent = []
+        self.size = []
+
+        for node in nodes:
+            self.add(node)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, node):
+        return node in self.index
+
+    def add(self, node):
+        # Return the slot for this node, creating a new single-node group if we have not seen it
+        slot = self.index.get(node)
+        if slot is None:
+            slot = len(self.labels)
+            self.index[node] = slot
+            self.labels.append(node)
+            self.parent.append(slot)
+            self.size.append(1)
+        return slot
+
+    def _find(self, slot):
+        parent = self.parent
+
+        # Path halving: point every other node at its grandparent while we climb.
+        # This is the iterative form of path compression, so deep trees cannot hit the recursion limit.
+        while parent[slot] != slot:
+            parent[slot] = parent[parent[slot]]
+            slot = parent[slot]
+        return slot
+
+    def find(self, node):
+        # The representative (root) label of the group that node belongs to.
+        # Like connected(), asking never creates a node: an unknown one raises KeyError.
+        return self.labels[self._find(self.index[node])]
+
+    def union(self, a, b):
+        root_a = self._find(self.add(a))
+        root_b = self._find(self.add(b))
+
+        if root_a == root_b:
+            return False
+
+        # Union by size: hang the smaller tree under the larger one
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+
+    def connected(self, a, b):
+        # Unknown nodes are not connected to anything (and we do not create them just to ask)
+        if a not in self.index or b not in self.index:
+            return False
+        return self._find(self.index[a]) == self._find(self.index[b])
+
+    def component_size(self, node):
+        if node not in self.index:
+            return 0
+        return self.size[self._find(self.index[node])]
+
+    def component_sizes(self):
+        # Only roots carry a meaningful size, so this is one pass over the slots
+        return {
+            self.labels[slot]: self.size[slot]
+            for slot in range(len(self.parent))
+            if self.parent[slot] == slot
+        }
+
+    def components(self):
+        # Group every node under its root label
+        groups = {}
+        for slot, label in enumerate(self.labels):
+            root = self.labels[self._find(slot)]
+            groups.setdefault(root, []).append(label)
+        return groups
+
+    @classmethod
+    def from_graph(cls, graph):
+        # Accepts the same dictionary format used in bfs.py / dfs.py:
+        # the key is the node and the value is a list of their neighbors.
+        # Edge direction is ignored, so the result is the (weakly) connected components.
+        disjoint_set = cls()
+        for node, neighbors in graph.items():
+            disjoint_set.add(node)
+            for neighbor in neighbors:
+                disjoint_set.union(node, neighbor)
+        return disjoint_set
+
+    @classmethod
+    def from_edges(cls, edges):
+        # Accepts any iterable of (a, b) pairs, so edges can be streamed from a file
+        # without ever holding the whole edge list in memory
+        disjoint_set = cls()
+        for a, b in edges:
+            disjoint_set.union(a, b)
+        return disjoint_set
+
+
+if __name__ == "__main__":
+    social_network = {
+        "You": ["Alice", "Bob"],
+        "Alice": ["Charlie"],
+        "Bob": ["Charlie", "Dave"],
+        "Charlie": ["Eve"],
+        "Dave": [],
+        "Eve": [],
+        "Frank": ["Grace"],
+        "Grace": [],
+    }
+
+    groups = DisjointSet.from_graph(social_network)
+
+    print(f"Are You and Eve connected? {groups.connected('You', 'Eve')}")  # True
+    print(f"Are You and Frank connected? {groups.connected('You', 'Frank')}")  # False
+    print(f"Component sizes: {groups.component_sizes()}")  # {'You': 6, 'Frank': 2}
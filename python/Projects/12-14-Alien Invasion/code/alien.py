@@ -1,6 +1,7 @@
-import pygame
 from pygame.sprite import Sprite
 
+from assets import load_image
+
 
 class Alien(Sprite):
     """A class to represent a single alien in the fleet."""
@@ -11,8 +12,8 @@ class Alien(Sprite):
         self.screen = ai_game.screen
         self.settings = ai_game.settings
 
-        # Load the alien image and set its rect attribute
-        self.image = pygame.image.load("images/alien.bmp")
+        # Load the alien image (shared by the whole fleet) and set its rect attribute
+        self.image = load_image("images/alien.bmp")
         self.rect = self.image.get_rect()
 
         # Start each new alien near the top left of the screen
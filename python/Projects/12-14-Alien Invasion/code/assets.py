@@ -0,0 +1,33 @@
+import pygame
+
+# Images already loaded, keyed by (path, alpha). Shared by every sprite in the process.
+_images = {}
+
+
+def load_image(path, alpha=False):
+    """
+    Return the image at path, loading it from disk only the first time.
+
+    Once the display exists the image is converted to the screen's pixel
+    format (convert_alpha() if it has transparency), so blitting it is fast.
+    Every caller gets the same Surface, so sprites must not draw on it.
+    """
+    key = (path, alpha)
+    image, converted = _images.get(key, (None, False))
+
+    if image is None:
+        image = pygame.image.load(path)
+
+    if not converted and pygame.display.get_surface() is not None:
+        # convert() needs a display mode, so an image loaded before
+        # set_mode() is converted the next time it's asked for
+        image = image.convert_alpha() if alpha else image.convert()
+        converted = True
+
+    _images[key] = (image, converted)
+    return image
+
+
+def clear():
+    """Forget every cached image (e.g. after changing the display mode)."""
+    _images.clear()
@@ -1,6 +1,7 @@
-import pygame
 from pygame.sprite import Sprite
 
+from assets import load_image
+
 
 class Ship(Sprite):
     """A class to manage the ship."""
@@ -14,8 +15,8 @@ class Ship(Sprite):
         self.settings = ai_game.settings
         self.screen_rect = ai_game.screen.get_rect()
 
-        # Load the ship image and get its rect
-        self.image = pygame.image.load("images/ship.bmp")
+        # Load the ship image (shared with the life icons) and get its rect
+        self.image = load_image("images/ship.bmp")
         self.rect = self.image.get_rect()
 
         # Start each new ship at the bottom center of the screen
@@ -1,42 +1,90 @@
+import threading
+from contextlib import ExitStack, contextmanager
+
+from registry import AccountRegistry
+
+
+@contextmanager
+def locked(*accounts):
+    # Lock several accounts at once, always in the same global order (by object id, which every
+    # account has whatever type its account_id is, so mixed int and str ids can be locked together).
+    # Two threads transferring A -> B and B -> A both lock A first, so neither can hold one lock
+    # while waiting forever for the other (deadlock).
+    unique = {id(account): account for account in accounts}
+    ordered = [unique[key] for key in sorted(unique)]
+    with ExitStack() as stack:
+        for account in ordered:
+            stack.enter_context(account._lock)
+        yield
+
+
 class BankAccount:
-    all_accounts = []
+    # Every account registers itself here: all_accounts.get(account_id) and
+    # all_accounts.find_by_owner(owner_name) are dict lookups, not list scans.
+    all_accounts = AccountRegistry()
+
+    # Callables told about every balance change: observer(event, account, amount, target_account).
+    # Events are "open", "deposit", "withdraw", "transfer" and "interest". They are sent while
+    # the account's lock is held, so observers see the changes to one account in order.
+    observers = []
 
     def __init__(self, account_id, owner_name, balance=0) -> None:
         self.account_id = account_id
         self.owner_name = owner_name
         self.balance = balance
-        BankAccount.all_accounts.append(self)
+        self._lock = threading.Lock()
+        BankAccount.all_accounts.add(self)
+        self._notify("open", balance)
+
+    def _notify(self, event, amount, target_account=None):
+        for observer in BankAccount.observers:
+            observer(event, self, amount, target_account)
 
     def deposit(self, amount):
-        self.balance += amount
-        return f"Deposited {amount}. New balance: {self.balance}"
+        with self._lock:
+            self.balance += amount
+            self._notify("deposit", amount)
+            return f"Deposited {amount}. New balance: {self.balance}"
 
     def withdraw(self, amount):
-        if amount <= self.balance:
-            self.balance -= amount
-            return f"Withdrew {amount}. New balance: {self.balance}"
-        else:
-            return "Insufficient funds"
+        with self._lock:
+            if amount <= self.balance:
+                self.balance -= amount
+                self._notify("withdraw", amount)
+                return f"Withdrew {amount}. New balance: {self.balance}"
+            else:
+                return "Insufficient funds"
 
     def get_balance(self):
         return f"Account balance: {self.balance}"
 
     def transfer(self, amount, target_account):
-        if amount <= self.balance:
-            self.balance -= amount
-            target_account.balance += amount
-
+        if self._move(amount, target_account):
             return f"Transferred {amount} to {target_account.owner_name}'s account"
         else:
             return "Insufficient funds for transfer"
 
+    def _move(self, amount, target_account):
+        # The check and both balance updates happen while holding both accounts' locks
+        with locked(self, target_account):
+            if amount <= self.balance:
+                self.balance -= amount
+                target_account.balance += amount
+                self._notify("transfer", amount, target_account)
+                return True
+            return False
+
 
 class SavingsAccount(BankAccount):
     def __init__(self, account_id, owner_name, balance=0, interest_rate=0.05) -> None:
-        super().__init__(account_id, owner_name, balance)
+        # Set before registering, so observers of the "open" event already see the rate
         self.interest_rate = interest_rate
+        super().__init__(account_id, owner_name, balance)
 
     def apply_interest(self):
-        if self.balance > 0:
-            self.balance += self.balance * self.interest_rate
-            return f"Interest applied. New balance: {self.balance}"
+        with self._lock:
+            if self.balance > 0:
+                interest = self.balance * self.interest_rate
+                self.balance += interest
+                self._notify("interest", interest)
+                return f"Interest applied. New balance: {self.balance}"
@@ -0,0 +1,202 @@
+import csv
+import math
+import time
+from collections import namedtuple
+from itertools import islice
+
+from bank import BankAccount, locked
+
+# One ledger line. target_id is only used by transfers.
+Transaction = namedtuple("Transaction", ["kind", "account_id", "amount", "target_id"], defaults=[None])
+
+KINDS = ("deposit", "withdraw", "transfer")
+
+
+def valid_amount(amount):
+    # A positive, finite number. A negative transfer would pull money out of the target,
+    # and NaN or infinity would poison every balance it touches. bool is an int, but not an amount.
+    return (
+        isinstance(amount, (int, float))
+        and not isinstance(amount, bool)
+        and math.isfinite(amount)
+        and amount > 0
+    )
+
+
+class BatchReport:
+    def __init__(self, batch_number, size, seconds, error=None):
+        self.batch_number = batch_number
+        self.size = size
+        self.seconds = seconds
+        self.error = error
+
+    @property
+    def applied(self):
+        return self.error is None
+
+    @property
+    def per_second(self):
+        return self.size / self.seconds if self.seconds > 0 else float("inf")
+
+    def __str__(self):
+        if not self.applied:
+            return f"Batch {self.batch_number}: rolled back ({self.error})"
+        return (
+            f"Batch {self.batch_number}: {self.size} transactions in {self.seconds:.4f}s "
+            f"({self.per_second:,.0f}/s)"
+        )
+
+
+class BatchProcessor:
+    # Applies deposits, withdrawals and transfers in batches, all or nothing.
+    # Each batch is first validated against staged balances (nothing is touched yet),
+    # then committed by writing the final balances. If anything goes wrong, the whole batch
+    # is rejected and every account keeps the balance it had before.
+    # Unlike the BankAccount methods, no result string is built per transaction.
+
+    def __init__(self, registry=None, batch_size=10_000):
+        self.registry = registry if registry is not None else BankAccount.all_accounts
+        self.batch_size = batch_size
+        self.batches_run = 0
+
+    def apply_batch(self, transactions):
+        self.batches_run += 1
+        start = time.perf_counter()
+        transactions = list(transactions)
+
+        # Look up every account the batch touches, then lock them all (in the global order)
+        # so no other thread can change a balance between validation and commit
+        accounts = {}
+        for line, (_, account_id, _, target_id) in enumerate(transactions, start=1):
+            for needed in (account_id, target_id):
+                if needed is None or needed in accounts:
+                    continue
+                account = self.registry.get(needed)
+                if account is None:
+                    return self._report(transactions, start, f"line {line}: account {needed} not found")
+                accounts[needed] = account
+
+        with locked(*accounts.values()):
+            staged, error = self._validate(transactions, accounts)
+            if error is not None:
+                # Nothing has been written yet, so rejecting the batch is the whole rollback
+                return self._report(transactions, start, error)
+            self._commit(staged)
+            if BankAccount.observers:
+                self._notify(transactions, accounts)
+
+        return self._report(transactions, start)
+
+    def _validate(self, transactions, accounts):
+        # Replay the batch against staged balances (account_id -> [account, balance so far])
+        staged = {
+            account_id: [account, account.balance] for account_id, account in accounts.items()
+        }
+
+        for line, (kind, account_id, amount, target_id) in enumerate(transactions, start=1):
+            if account_id is None:
+                return staged, f"line {line}: transaction has no account"
+            if not valid_amount(amount):
+                return staged, f"line {line}: invalid amount {amount!r}"
+            source = staged[account_id]
+
+            if kind == "deposit":
+                source[1] += amount
+            elif kind == "withdraw":
+                if amount > source[1]:
+                    return staged, f"line {line}: insufficient funds in account {account_id}"
+                source[1] -= amount
+            elif kind == "transfer":
+                target = staged[target_id] if target_id is not None else None
+                if target is None:
+                    return staged, f"line {line}: transfer has no target account"
+                if amount > source[1]:
+                    return staged, f"line {line}: insufficient funds in account {account_id}"
+                source[1] -= amount
+                target[1] += amount
+            else:
+                return staged, f"line {line}: unknown transaction kind {kind!r}"
+
+        return staged, None
+
+    def _commit(self, staged):
+        entries = list(staged.values())
+        originals = [(account, account.balance) for account, _ in entries]
+        try:
+            for account, balance in entries:
+                account.balance = balance
+        except BaseException:
+            for account, balance in originals:
+                account.balance = balance
+            raise
+
+    def _notify(self, transactions, accounts):
+        # Observers (journal, event log) still see every transaction, in batch order
+        for kind, account_id, amount, target_id in transactions:
+            target = accounts[target_id] if kind == "transfer" else None
+            accounts[account_id]._notify(kind, amount, target)
+
+    def _report(self, transactions, start, error=None):
+        return BatchReport(self.batches_run, len(transactions), time.perf_counter() - start, error)
+
+    def run(self, transactions):
+        # Split any iterable (a list, a generator, read_transactions(path)) into batches lazily,
+        # so millions of transactions never have to sit in memory at once
+        transactions = iter(transactions)
+        reports = []
+        while True:
+            batch = list(islice(transactions, self.batch_size))
+            if not batch:
+                return reports
+            reports.append(self.apply_batch(batch))
+
+
+def _parse_number(text):
+    return float(text) if "." in text else int(text)
+
+
+def _parse_id(text):
+    return int(text) if text.isdigit() else text
+
+
+def read_transactions(path):
+    # Streams a CSV of kind,account_id,amount[,target_id] lines (a header row is optional)
+    with open(path, newline="") as file:
+        for row in csv.reader(file):
+            if not row or row[0] == "kind":
+                continue
+            kind = row[0].strip()
+            if kind not in KINDS:
+                raise ValueError(f"Unknown transaction kind: {kind}")
+            target_id = _parse_id(row[3].strip()) if len(row) > 3 and row[3].strip() else None
+            yield Transaction(kind, _parse_id(row[1].strip()), _parse_number(row[2].strip()), target_id)
+
+
+def summarise(reports):
+    applied = [report for report in reports if report.applied]
+    transactions = sum(report.size for report in applied)
+    seconds = sum(report.seconds for report in applied)
+    rate = transactions / seconds if seconds > 0 else 0
+    return (
+        f"{len(applied)}/{len(reports)} batches applied, {transactions} transactions "
+        f"in {seconds:.3f}s ({rate:,.0f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    import random
+
+    accounts = [BankAccount(i, f"Owner {i}", 1000) for i in range(10_000)]
+
+    def ledger(count):
+        for _ in range(count):
+            account_id = random.randrange(len(accounts))
+            kind = random.choice(KINDS)
+            target_id = random.randrange(len(accounts)) if kind == "transfer" else None
+            yield Transaction(kind, account_id, random.randint(1, 50), target_id)
+
+    processor = BatchProcessor(batch_size=50_000)
+    reports = processor.run(ledger(1_000_000))
+    for report in reports[:3]:
+        print(report)
+    print(summarise(reports))
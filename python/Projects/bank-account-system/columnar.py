@@ -0,0 +1,228 @@
+import numpy as np
+
+# Struct-of-arrays account store.
+# A million BankAccount objects means a million Python objects, and month-end interest means a
+# million apply_interest() calls. Here every field is one NumPy column instead (ids, balances,
+# rates), so interest, fees and reports are single vectorised operations over whole columns.
+# Balances are integer cents, so repeated operations never pick up floating-point drift.
+
+
+def to_cents(amount):
+    return int(round(amount * 100))
+
+
+def format_cents(cents):
+    # 120000 -> "1200", 120050 -> "1200.50", matching how BankAccount prints whole amounts
+    cents = int(cents)
+    if cents % 100 == 0:
+        return str(cents // 100)
+    return f"{cents / 100:.2f}"
+
+
+class ColumnarAccounts:
+    def __init__(self, capacity=1_024):
+        self.size = 0
+        self.account_id = np.zeros(capacity, dtype=np.int64)
+        self.balance_cents = np.zeros(capacity, dtype=np.int64)
+        self.interest_rate = np.zeros(capacity, dtype=np.float64)
+        self.owner_name = []
+        self._row_of = {}  # account_id -> row
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, account_id):
+        return account_id in self._row_of
+
+    def __getitem__(self, account_id):
+        return AccountView(self, self._row_of[account_id])
+
+    def get(self, account_id):
+        row = self._row_of.get(account_id)
+        return AccountView(self, row) if row is not None else None
+
+    def __iter__(self):
+        for row in range(self.size):
+            yield AccountView(self, row)
+
+    def _reserve(self, extra):
+        # Grow every column together, doubling so appends stay cheap on average
+        needed = self.size + extra
+        capacity = len(self.account_id)
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 1)  # An empty store (capacity=0) would never grow by doubling
+        while capacity < needed:
+            capacity *= 2
+        for column in ("account_id", "balance_cents", "interest_rate"):
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, column, new)
+
+    def add(self, account_id, owner_name, balance=0, interest_rate=0.0):
+        return self.extend([account_id], [owner_name], [balance], [interest_rate])[0]
+
+    def extend(self, account_ids, owner_names, balances, interest_rates=None):
+        # Bulk insert; balances are in currency units and stored as cents
+        account_ids = np.asarray(account_ids, dtype=np.int64)
+        count = len(account_ids)
+        owner_names = list(owner_names)
+        balances = np.asarray(balances, dtype=np.float64)
+        if interest_rates is not None:
+            interest_rates = np.asarray(interest_rates, dtype=np.float64)
+        # Check everything before writing anything, so a bad call leaves no half-written rows
+        columns = [owner_names, balances] if interest_rates is None else [owner_names, balances, interest_rates]
+        if any(len(column) != count for column in columns):
+            raise ValueError("Account ids, owner names, balances and interest rates must have the same length")
+        if len(set(account_ids.tolist())) != count or any(i in self._row_of for i in account_ids.tolist()):
+            raise ValueError("Account ids must be unique")
+
+        self._reserve(count)
+        rows = slice(self.size, self.size + count)
+        self.account_id[rows] = account_ids
+        self.balance_cents[rows] = np.rint(balances * 100)
+        self.interest_rate[rows] = 0.0 if interest_rates is None else interest_rates
+        self.owner_name.extend(owner_names)
+
+        first = self.size
+        for offset, account_id in enumerate(account_ids.tolist()):
+            self._row_of[account_id] = first + offset
+        self.size += count
+        return [AccountView(self, row) for row in range(first, self.size)]
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        # Import existing BankAccount / SavingsAccount objects
+        accounts = list(accounts)
+        store = cls(capacity=max(1, len(accounts)))
+        store.extend(
+            [account.account_id for account in accounts],
+            [account.owner_name for account in accounts],
+            [account.balance for account in accounts],
+            [getattr(account, "interest_rate", 0.0) for account in accounts],
+        )
+        return store
+
+    def apply_interest(self):
+        # SavingsAccount.apply_interest for every account at once: positive balances earn
+        # balance * rate, rounded to the nearest cent. Returns the total interest paid, in cents.
+        balances = self.balance_cents[: self.size]
+        rates = self.interest_rate[: self.size]
+        interest = np.where(balances > 0, np.rint(balances * rates), 0).astype(np.int64)
+        balances += interest
+        return int(interest.sum())
+
+    def apply_fee(self, fee, minimum_balance=None):
+        # Charge a flat fee to every account (or only those below minimum_balance).
+        # The fee never takes a balance below zero. Returns the total collected, in cents.
+        balances = self.balance_cents[: self.size]
+        charge = np.minimum(to_cents(fee), np.maximum(balances, 0))
+        if minimum_balance is not None:
+            charge = np.where(balances < to_cents(minimum_balance), charge, 0)
+        balances -= charge
+        return int(charge.sum())
+
+    def balance_report(self):
+        balances = self.balance_cents[: self.size]
+        if self.size == 0:
+            return {"accounts": 0, "total": 0, "mean": 0, "min": 0, "median": 0, "max": 0, "overdrawn": 0}
+        return {
+            "accounts": self.size,
+            "total": int(balances.sum()) / 100,
+            "mean": float(balances.mean()) / 100,
+            "min": int(balances.min()) / 100,
+            "median": float(np.median(balances)) / 100,
+            "max": int(balances.max()) / 100,
+            "overdrawn": int((balances < 0).sum()),
+        }
+
+
+class AccountView:
+    # Looks and behaves like a BankAccount / SavingsAccount, but reads and writes one row of the store
+    __slots__ = ("store", "row")
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    @property
+    def account_id(self):
+        return int(self.store.account_id[self.row])
+
+    @property
+    def owner_name(self):
+        return self.store.owner_name[self.row]
+
+    @property
+    def balance_cents(self):
+        return int(self.store.balance_cents[self.row])
+
+    @property
+    def balance(self):
+        return self.balance_cents / 100
+
+    @balance.setter
+    def balance(self, amount):
+        self.store.balance_cents[self.row] = to_cents(amount)
+
+    @property
+    def interest_rate(self):
+        return float(self.store.interest_rate[self.row])
+
+    def deposit(self, amount):
+        self.store.balance_cents[self.row] += to_cents(amount)
+        return f"Deposited {amount}. New balance: {format_cents(self.balance_cents)}"
+
+    def withdraw(self, amount):
+        cents = to_cents(amount)
+        if cents <= self.balance_cents:
+            self.store.balance_cents[self.row] -= cents
+            return f"Withdrew {amount}. New balance: {format_cents(self.balance_cents)}"
+        else:
+            return "Insufficient funds"
+
+    def get_balance(self):
+        return f"Account balance: {format_cents(self.balance_cents)}"
+
+    def transfer(self, amount, target_account):
+        cents = to_cents(amount)
+        if cents <= self.balance_cents:
+            self.store.balance_cents[self.row] -= cents
+            target_account.store.balance_cents[target_account.row] += cents
+            return f"Transferred {amount} to {target_account.owner_name}'s account"
+        else:
+            return "Insufficient funds for transfer"
+
+    def apply_interest(self):
+        if self.balance_cents > 0:
+            self.store.balance_cents[self.row] += int(round(self.balance_cents * self.interest_rate))
+            return f"Interest applied. New balance: {format_cents(self.balance_cents)}"
+
+    def __repr__(self):
+        return f"AccountView(account_id={self.account_id}, owner_name={self.owner_name!r}, balance={self.balance})"
+
+
+if __name__ == "__main__":
+    import time
+
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+
+    store = ColumnarAccounts(capacity=count)
+    store.extend(
+        np.arange(count),
+        [f"Owner {i}" for i in range(count)],
+        rng.integers(0, 1_000_000, count) / 100,
+        rng.choice([0.0, 0.01, 0.05], count),
+    )
+
+    start = time.perf_counter()
+    paid = store.apply_interest()
+    print(f"Interest on {count:,} accounts: {format_cents(paid)} paid in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    collected = store.apply_fee(5, minimum_balance=100)
+    print(f"Fee sweep: {format_cents(collected)} collected in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    print(store.balance_report())
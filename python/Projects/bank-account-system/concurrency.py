@@ -0,0 +1,88 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from bank import BankAccount
+
+
+class ConcurrentTransferExecutor:
+    # Runs transfers on a thread pool. Each transfer locks its two accounts in the global order
+    # (see bank.locked), so transfers between unrelated accounts never wait on each other
+    # and opposite transfers (A -> B while B -> A) cannot deadlock.
+
+    def __init__(self, registry=None, workers=8, chunk_size=1_000):
+        self.registry = registry if registry is not None else BankAccount.all_accounts
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def transfer(self, source_id, target_id, amount):
+        source = self.registry.get(source_id)
+        target = self.registry.get(target_id)
+        if source is None or target is None:
+            return False
+        return source._move(amount, target)
+
+    def _run_chunk(self, chunk):
+        succeeded = 0
+        for source_id, target_id, amount in chunk:
+            if self.transfer(source_id, target_id, amount):
+                succeeded += 1
+        return succeeded, len(chunk) - succeeded
+
+    def run(self, transfers):
+        # transfers is any iterable of (source_id, target_id, amount).
+        # Work is handed out in chunks so the pool is not flooded with one future per transfer.
+        transfers = iter(transfers)
+        succeeded = failed = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = []
+            while True:
+                chunk = list(islice(transfers, self.chunk_size))
+                if not chunk:
+                    break
+                futures.append(pool.submit(self._run_chunk, chunk))
+            for future in futures:
+                ok, not_ok = future.result()
+                succeeded += ok
+                failed += not_ok
+        return succeeded, failed
+
+
+def stress_test(num_accounts=100, num_transfers=200_000, workers=32, hot_accounts=None):
+    # Hammer a small set of accounts from many threads and check no money appears or disappears.
+    # hot_accounts limits transfers to the first few accounts, to force heavy lock contention.
+    BankAccount.all_accounts.clear()
+    accounts = [BankAccount(i, f"Owner {i}", 1_000) for i in range(num_accounts)]
+    total_before = sum(account.balance for account in accounts)
+
+    pick_from = hot_accounts or num_accounts
+    rng = random.Random(0)
+    transfers = [
+        (rng.randrange(pick_from), rng.randrange(pick_from), rng.randint(1, 100))
+        for _ in range(num_transfers)
+    ]
+
+    executor = ConcurrentTransferExecutor(workers=workers)
+    start = time.perf_counter()
+    succeeded, failed = executor.run(transfers)
+    elapsed = time.perf_counter() - start
+
+    total_after = sum(account.balance for account in accounts)
+    return {
+        "transfers": num_transfers,
+        "succeeded": succeeded,
+        "failed": failed,
+        "seconds": elapsed,
+        "per_second": num_transfers / elapsed if elapsed else float("inf"),
+        "conserved": total_before == total_after,
+    }
+
+
+if __name__ == "__main__":
+    for workers in (1, 4, 32):
+        result = stress_test(workers=workers, hot_accounts=10)
+        print(
+            f"{workers:>2} workers: {result['per_second']:,.0f} transfers/s, "
+            f"{result['failed']} declined, money conserved: {result['conserved']}"
+        )
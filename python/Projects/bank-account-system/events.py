@@ -0,0 +1,146 @@
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from bank import BankAccount
+
+# Event-sourced balance history.
+# Every balance change made through BankAccount is recorded as (time, kind, delta). The balance at
+# any moment is then just the sum of the deltas up to that moment, but summing millions of events
+# per query is slow. So every `checkpoint_every` events we also remember the running balance.
+# "Balance as of T" finds the last checkpoint before T (binary search) and only adds up the short
+# tail of events after it: at most checkpoint_every additions, however long the history is.
+
+
+class AccountHistory:
+    __slots__ = ("times", "deltas", "kinds", "checkpoints", "balance")
+
+    def __init__(self):
+        self.times = array("d")
+        self.deltas = array("d")
+        self.kinds = []
+        self.checkpoints = array("d", [0.0])  # checkpoints[c] = balance after the first c * N events
+        self.balance = 0.0
+
+
+class BalanceEventLog:
+    def __init__(self, checkpoint_every=64, clock=time.time):
+        self.checkpoint_every = checkpoint_every
+        self.clock = clock
+        self.histories = {}  # account_id -> AccountHistory
+        self.events = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, event, account, amount, target_account=None):
+        # BankAccount observer
+        with self._lock:
+            when = self.clock()
+            if event in ("open", "deposit", "interest"):
+                self._record(account.account_id, when, event, amount)
+            elif event == "withdraw":
+                self._record(account.account_id, when, event, -amount)
+            elif event == "transfer":
+                self._record(account.account_id, when, "transfer_out", -amount)
+                self._record(target_account.account_id, when, "transfer_in", amount)
+
+    def _record(self, account_id, when, kind, delta):
+        history = self.histories.get(account_id)
+        if history is None or kind == "open":
+            # Re-opening an id starts a fresh history
+            history = self.histories[account_id] = AccountHistory()
+
+        # Keep times sorted for the binary search, even if the clock steps backwards
+        if history.times and when < history.times[-1]:
+            when = history.times[-1]
+
+        history.times.append(when)
+        history.deltas.append(delta)
+        history.kinds.append(kind)
+        history.balance += delta
+        if len(history.deltas) % self.checkpoint_every == 0:
+            history.checkpoints.append(history.balance)
+        self.events += 1
+
+    def attach(self):
+        BankAccount.observers.append(self)
+        return self
+
+    def detach(self):
+        if self in BankAccount.observers:
+            BankAccount.observers.remove(self)
+
+    def _balance_after(self, history, count):
+        # Balance after the first `count` events: nearest checkpoint, plus the tail after it
+        checkpoint = count // self.checkpoint_every
+        start = checkpoint * self.checkpoint_every
+        return sum(history.deltas[start:count], history.checkpoints[checkpoint])
+
+    def balance_as_of(self, account_id, when):
+        # The balance right after every event at or before `when`; None if the account did not exist yet
+        history = self.histories.get(account_id)
+        if history is None:
+            return None
+        count = bisect_right(history.times, when)
+        if count == 0:
+            return None
+        return self._balance_after(history, count)
+
+    def window(self, account_id, start, end):
+        # The raw events with start <= time <= end: (opening balance, times, kinds, deltas).
+        # The columns are slices, so they can be pickled cheaply and sent to another process.
+        history = self.histories.get(account_id)
+        if history is None:
+            return None
+
+        first = bisect_left(history.times, start)
+        last = bisect_right(history.times, end)
+        return (
+            self._balance_after(history, first),
+            history.times[first:last],
+            history.kinds[first:last],
+            history.deltas[first:last],
+        )
+
+    def statement(self, account_id, start, end):
+        # Every event with start <= time <= end, with the running balance after each one
+        window = self.window(account_id, start, end)
+        if window is None:
+            return None
+
+        opening_balance, times, kinds, deltas = window
+        balance = opening_balance
+        entries = []
+        for when, kind, delta in zip(times, kinds, deltas):
+            balance += delta
+            entries.append((when, kind, delta, balance))
+
+        return {
+            "account_id": account_id,
+            "opening_balance": opening_balance,
+            "closing_balance": balance,
+            "entries": entries,
+        }
+
+
+if __name__ == "__main__":
+    import random
+
+    log = BalanceEventLog(checkpoint_every=128).attach()
+    accounts = [BankAccount(i, f"Owner {i}", 1_000) for i in range(100)]
+    for _ in range(1_000_000):
+        source, target = random.sample(accounts, 2)
+        source.transfer(random.randint(1, 20), target)
+    log.detach()
+
+    history = log.histories[0]
+    middle = history.times[len(history.times) // 2]
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        log.balance_as_of(0, middle)
+    elapsed = time.perf_counter() - start
+    print(f"{log.events:,} events logged; balance_as_of takes {elapsed / 10_000 * 1e6:.1f} µs")
+
+    statement = log.statement(0, history.times[10], history.times[20])
+    print(f"Statement: {statement['opening_balance']} -> {statement['closing_balance']}, {len(statement['entries'])} entries")
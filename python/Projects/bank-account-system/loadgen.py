@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from bank import BankAccount
+from service import BankService
+
+# Load generator for service.py: many concurrent clients, each sending one request at a time
+# and timing the round trip. Reports requests per second and p50 / p99 latency.
+# Without --port it starts its own service in this process, so it runs with no setup at all.
+
+OPS = ("deposit", "withdraw", "transfer", "balance")
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def _client(host, port, requests, num_accounts, latencies, declined, rng):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            op = rng.choice(OPS)
+            request = {"op": op, "account_id": rng.randint(1, num_accounts), "amount": rng.randint(1, 50)}
+            if op == "transfer":
+                request["target_id"] = rng.randint(1, num_accounts)
+
+            start = time.perf_counter()
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if not response["ok"]:
+                declined.append(response["message"])
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(clients=100, requests_per_client=200, num_accounts=1_000, host="127.0.0.1", port=None, seed=0):
+    service = server = None
+    accounts = []
+    if port is None:
+        # Local mode: create the accounts and a service on a free port.
+        # The registry only holds weak references, so we keep the accounts alive in a list.
+        accounts = [BankAccount(i, f"Owner {i}", 1_000) for i in range(1, num_accounts + 1)]
+        service = BankService()
+        server = await service.start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    rng = random.Random(seed)
+    latencies = []
+    declined = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                _client(host, port, requests_per_client, num_accounts, latencies, declined, random.Random(rng.random()))
+                for _ in range(clients)
+            )
+        )
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "declined": len(declined),
+        "seconds": elapsed,
+        "per_second": len(latencies) / elapsed if elapsed else float("inf"),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "average_batch": service.average_batch_size if service else None,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the bank service")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--accounts", type=int, default=1_000)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="connect to a running service instead of starting one")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load(args.clients, args.requests, args.accounts, args.host, args.port))
+    print(
+        f"{result['requests']:,} requests in {result['seconds']:.2f}s: {result['per_second']:,.0f} req/s, "
+        f"p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, {result['declined']:,} declined"
+    )
+    if result["average_batch"] is not None:
+        print(f"Average micro-batch: {result['average_batch']:.1f} requests")
@@ -0,0 +1,81 @@
+import weakref
+
+
+class _AccountRef(weakref.ref):
+    # A weak reference that also remembers where the account was indexed,
+    # so it can be cleaned up after the account itself is gone
+    __slots__ = ("account_id", "owner_name")
+
+
+class AccountRegistry:
+    # Accounts are stored in a dict keyed by account_id, so lookup and removal are O(1).
+    # The registry only holds weak references: once nothing else uses an account, it drops out
+    # on its own instead of living forever in a class-level list.
+
+    def __init__(self):
+        self._by_id = {}  # account_id -> _AccountRef
+        self._by_owner = {}  # owner_name -> {account_id: None}, an insertion-ordered set
+        # One shared callback for every reference (a closure per account would cost far more memory)
+        self._forget_callback = self._forget
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, account_id):
+        return self.get(account_id) is not None
+
+    def __iter__(self):
+        for ref in list(self._by_id.values()):
+            account = ref()
+            if account is not None:
+                yield account
+
+    def add(self, account):
+        account_id = account.account_id
+
+        # Re-using an id replaces the old account
+        self.remove(account_id)
+
+        ref = _AccountRef(account, self._forget_callback)
+        ref.account_id = account_id
+        ref.owner_name = account.owner_name
+        self._by_id[account_id] = ref
+        self._by_owner.setdefault(ref.owner_name, {})[account_id] = None
+
+    def _forget(self, ref):
+        # Called when an account is garbage collected. Only drop the entry if it still
+        # points at that account (the id may have been re-used since).
+        if self._by_id.get(ref.account_id) is ref:
+            del self._by_id[ref.account_id]
+            self._unindex_owner(ref.owner_name, ref.account_id)
+
+    def get(self, account_id):
+        ref = self._by_id.get(account_id)
+        return ref() if ref is not None else None
+
+    def find_by_owner(self, owner_name):
+        accounts = []
+        for account_id in self._by_owner.get(owner_name, ()):
+            account = self.get(account_id)
+            if account is not None:
+                accounts.append(account)
+        return accounts
+
+    def remove(self, account_id):
+        ref = self._by_id.pop(account_id, None)
+        if ref is None:
+            return None
+
+        self._unindex_owner(ref.owner_name, account_id)
+        return ref()
+
+    def clear(self):
+        self._by_id.clear()
+        self._by_owner.clear()
+
+    def _unindex_owner(self, owner_name, account_id):
+        account_ids = self._by_owner.get(owner_name)
+        if account_ids is not None:
+            account_ids.pop(account_id, None)
+            if not account_ids:
+                del self._by_owner[owner_name]
@@ -0,0 +1,165 @@
+import asyncio
+import json
+
+from bank import BankAccount, locked
+from batch import valid_amount
+
+# A small banking service over TCP. Each request and response is one line of JSON:
+#   -> {"op": "transfer", "account_id": 1, "amount": 50, "target_id": 2}
+#   <- {"ok": true, "balance": 950}
+# Supported ops: "deposit", "withdraw", "transfer" and "balance". A declined or invalid request
+# gets "ok": false and a "message" saying why.
+#
+# Requests are not executed the moment they arrive. They are queued, and once per event-loop tick
+# everything that arrived in the meantime is executed together as one micro-batch: every account
+# the batch touches is locked once, and the requests are applied in arrival order without going
+# through the BankAccount methods (so no result string is built per request). Under load this
+# turns thousands of tiny wake-ups and lock round-trips into a few larger ones.
+
+OPS = ("deposit", "withdraw", "transfer", "balance")
+
+
+class BankService:
+    def __init__(self, registry=None):
+        self.registry = registry if registry is not None else BankAccount.all_accounts
+        self._pending = []
+        self._flush_scheduled = False
+        self.batches = 0
+        self.requests = 0
+
+    @property
+    def average_batch_size(self):
+        return self.requests / self.batches if self.batches else 0
+
+    async def handle(self, request):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if not self._flush_scheduled:
+            # call_soon runs after every callback already waiting in this tick, so requests from
+            # all connections that are ready right now end up in the same batch
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self):
+        batch, self._pending = self._pending, []
+        self._flush_scheduled = False
+        self.batches += 1
+        self.requests += len(batch)
+
+        batch = [(request, future) for request, future in batch if not future.cancelled()]
+        try:
+            responses = self.execute_batch([request for request, _ in batch])
+        except Exception as error:
+            # Every client in the batch is awaiting its future: fail them all rather than hang them
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), response in zip(batch, responses):
+            future.set_result(response)
+
+    def execute(self, request):
+        return self.execute_batch([request])[0]
+
+    def execute_batch(self, requests):
+        # One response per request, in order. Requests are independent: a declined one does not
+        # undo the others (unlike BatchProcessor, which is all or nothing).
+        responses = [None] * len(requests)
+        work = []  # (position, op, account, amount, target)
+        accounts = []
+
+        # Look up every account first, so they can all be locked together (in the global order)
+        for position, request in enumerate(requests):
+            try:
+                op = request["op"]
+                account = self.registry.get(request["account_id"])
+                if account is None:
+                    responses[position] = {"ok": False, "message": "Account not found"}
+                    continue
+                if op not in OPS:
+                    responses[position] = {"ok": False, "message": f"Unknown operation: {op}"}
+                    continue
+
+                amount = target = None
+                if op != "balance":
+                    amount = request["amount"]
+                    if not valid_amount(amount):
+                        responses[position] = {"ok": False, "message": "Invalid amount"}
+                        continue
+                if op == "transfer":
+                    target = self.registry.get(request["target_id"])
+                    if target is None:
+                        responses[position] = {"ok": False, "message": "Target account not found"}
+                        continue
+                    accounts.append(target)
+            except Exception as error:
+                responses[position] = {"ok": False, "message": f"Bad request: {error}"}
+                continue
+            accounts.append(account)
+            work.append((position, op, account, amount, target))
+
+        with locked(*accounts):
+            for position, op, account, amount, target in work:
+                try:
+                    responses[position] = self._apply(op, account, amount, target)
+                except Exception as error:
+                    # Anything unexpected fails before this request writes a balance
+                    responses[position] = {"ok": False, "message": f"Bad request: {error}"}
+        return responses
+
+    def _apply(self, op, account, amount, target):
+        # Caller holds the locks of account and target
+        if op == "deposit":
+            account.balance += amount
+        elif op == "withdraw":
+            if amount > account.balance:
+                return {"ok": False, "balance": account.balance, "message": "Insufficient funds"}
+            account.balance -= amount
+        elif op == "transfer":
+            if amount > account.balance:
+                return {"ok": False, "balance": account.balance, "message": "Insufficient funds for transfer"}
+            account.balance -= amount
+            target.balance += amount
+
+        if op != "balance" and BankAccount.observers:
+            # Observers (journal, event log) see the same events the BankAccount methods send
+            account._notify(op, amount, target)
+        return {"ok": True, "balance": account.balance}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    response = {"ok": False, "message": "Invalid JSON"}
+                else:
+                    response = await self.handle(request)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+async def serve(host="127.0.0.1", port=8765):
+    service = BankService()
+    server = await service.start(host, port)
+    print(f"Bank service listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    # The registry only holds weak references, so the list keeps the demo accounts alive
+    accounts = [BankAccount(i, f"Owner {i}", 1_000) for i in range(1, 101)]
+    asyncio.run(serve())
@@ -0,0 +1,169 @@
+import csv
+import gzip
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from bank import BankAccount
+
+# Streaming statement export.
+# Nothing is built up as one big list of strings. Accounts are read in shards (runs of
+# `shard_size` account ids), each shard is turned into plain tuples, and a worker process streams
+# those tuples through a generator into its own buffered (optionally gzipped) part file.
+# Only a few shards are in flight at once, so memory stays flat however many accounts there are.
+
+ACCOUNT_FIELDS = ("account_id", "owner_name", "balance", "interest_rate")
+TRANSACTION_FIELDS = ("account_id", "time", "kind", "amount", "balance")
+FORMATS = ("csv", "jsonl")
+
+BUFFER_SIZE = 1 << 20  # 1 MiB write buffer: few large writes instead of one per row
+
+
+def open_output(path, compress=False):
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=6)
+    return open(path, "w", encoding="utf-8", newline="", buffering=BUFFER_SIZE)
+
+
+def account_snapshots(accounts):
+    # Plain tuples rather than account objects: small, and they pickle without locks or registries
+    for account in accounts:
+        yield (account.account_id, account.owner_name, account.balance, getattr(account, "interest_rate", None))
+
+
+def transaction_snapshots(log, account_ids, start=-math.inf, end=math.inf):
+    for account_id in account_ids:
+        window = log.window(account_id, start, end)
+        if window is not None and window[1]:
+            yield (account_id, *window)
+
+
+def account_rows(snapshots):
+    for account_id, owner_name, balance, interest_rate in snapshots:
+        yield (account_id, owner_name, balance, "" if interest_rate is None else interest_rate)
+
+
+def transaction_rows(snapshots):
+    for account_id, opening_balance, times, kinds, deltas in snapshots:
+        balance = opening_balance
+        for when, kind, delta in zip(times, kinds, deltas):
+            balance += delta
+            yield (account_id, when, kind, delta, balance)
+
+
+def write_rows(output, rows, fields, fmt="csv", header=True):
+    # Streams rows into an open file and returns how many were written
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(output)
+        if header:
+            writer.writerow(fields)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    elif fmt == "jsonl":
+        for row in rows:
+            output.write(json.dumps(dict(zip(fields, row))))
+            output.write("\n")
+            count += 1
+    else:
+        raise ValueError(f"Unknown format: {fmt} (expected one of {FORMATS})")
+    return count
+
+
+_ROW_BUILDERS = {
+    "accounts": (account_rows, ACCOUNT_FIELDS),
+    "transactions": (transaction_rows, TRANSACTION_FIELDS),
+}
+
+
+def _write_part(path, kind, snapshots, fmt, compress):
+    # Runs in a worker process: one shard in, one part file out
+    build_rows, fields = _ROW_BUILDERS[kind]
+    with open_output(path, compress) as output:
+        count = write_rows(output, build_rows(snapshots), fields, fmt)
+    return path, count
+
+
+def _part_path(prefix, kind, number, fmt, compress):
+    return f"{prefix}-{kind}-{number:05d}.{fmt}" + (".gz" if compress else "")
+
+
+def _shards(account_ids, shard_size):
+    account_ids = iter(account_ids)
+    while shard := list(islice(account_ids, shard_size)):
+        yield shard
+
+
+def _export(kind, shard_snapshots, prefix, fmt, compress, processes):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt} (expected one of {FORMATS})")
+    directory = os.path.dirname(prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    parts = []
+    jobs = ((_part_path(prefix, kind, number, fmt, compress), list(snapshots))
+            for number, snapshots in enumerate(shard_snapshots))
+
+    if processes == 1:
+        for path, snapshots in jobs:
+            parts.append(_write_part(path, kind, snapshots, fmt, compress))
+        return parts
+
+    workers = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        in_flight = deque()
+        for path, snapshots in jobs:
+            # Bound the shards waiting in the pool, so snapshots are not all built up front
+            if len(in_flight) >= workers * 2:
+                parts.append(in_flight.popleft().result())
+            in_flight.append(pool.submit(_write_part, path, kind, snapshots, fmt, compress))
+        while in_flight:
+            parts.append(in_flight.popleft().result())
+    return parts
+
+
+def export_accounts(prefix, registry=None, fmt="csv", compress=False, shard_size=100_000, processes=None):
+    # One row per account. Returns [(part_path, rows_written), ...] in shard order.
+    registry = registry if registry is not None else BankAccount.all_accounts
+    shards = (account_snapshots(shard) for shard in _shards(registry, shard_size))
+    return _export("accounts", shards, prefix, fmt, compress, processes)
+
+
+def export_transactions(prefix, log, start=-math.inf, end=math.inf, fmt="csv", compress=False,
+                        shard_size=10_000, processes=None):
+    # One row per balance change recorded in a BalanceEventLog between start and end,
+    # with the running balance after it
+    shards = (transaction_snapshots(log, shard, start, end) for shard in _shards(list(log.histories), shard_size))
+    return _export("transactions", shards, prefix, fmt, compress, processes)
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+
+    from events import BalanceEventLog
+
+    log = BalanceEventLog().attach()
+    accounts = [BankAccount(i, f"Owner {i}", 1_000) for i in range(200_000)]
+    for _ in range(200_000):
+        source, target = random.sample(accounts, 2)
+        source.transfer(random.randint(1, 20), target)
+    log.detach()
+
+    with tempfile.TemporaryDirectory() as folder:
+        prefix = os.path.join(folder, "statement")
+        for compress in (False, True):
+            start = time.perf_counter()
+            parts = export_accounts(prefix, fmt="csv", compress=compress)
+            parts += export_transactions(prefix, log, fmt="jsonl", compress=compress)
+            elapsed = time.perf_counter() - start
+            rows = sum(count for _, count in parts)
+            size = sum(os.path.getsize(path) for path, _ in parts)
+            label = "gzip" if compress else "plain"
+            print(f"{label:>5}: {rows:,} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s), {size / 1e6:.1f} MB")
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+from bank import BankAccount
+from batch import BatchProcessor, Transaction, read_transactions
+
+
+class TestBatchProcessor(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.acc1 = BankAccount(1, "Pius", 1000)
+        self.acc2 = BankAccount(2, "Jane", 500)
+        self.processor = BatchProcessor(batch_size=3)
+
+    def test_batch_applies_all_transactions(self):
+        report = self.processor.apply_batch([
+            Transaction("deposit", 1, 200),
+            Transaction("withdraw", 2, 100),
+            Transaction("transfer", 1, 300, 2),
+        ])
+        self.assertTrue(report.applied)
+        self.assertEqual(report.size, 3)
+        self.assertEqual(self.acc1.balance, 900)
+        self.assertEqual(self.acc2.balance, 700)
+
+    def test_failed_transaction_rolls_back_whole_batch(self):
+        report = self.processor.apply_batch([
+            Transaction("deposit", 1, 200),
+            Transaction("withdraw", 2, 5000),
+        ])
+        self.assertFalse(report.applied)
+        self.assertIn("line 2", report.error)
+        self.assertEqual(self.acc1.balance, 1000)
+        self.assertEqual(self.acc2.balance, 500)
+
+    def test_later_lines_see_earlier_lines_of_the_batch(self):
+        # The withdrawal only succeeds because of the deposit before it
+        report = self.processor.apply_batch([
+            Transaction("deposit", 2, 1000),
+            Transaction("withdraw", 2, 1200),
+        ])
+        self.assertTrue(report.applied)
+        self.assertEqual(self.acc2.balance, 300)
+
+    def test_unknown_account_rejects_batch(self):
+        report = self.processor.apply_batch([Transaction("transfer", 1, 10, 99)])
+        self.assertFalse(report.applied)
+        self.assertEqual(self.acc1.balance, 1000)
+
+    def test_invalid_amounts_reject_batch(self):
+        for amount in (-500, 0, float("nan"), float("inf"), True, "10"):
+            report = self.processor.apply_batch([
+                Transaction("deposit", 1, 5),
+                Transaction("transfer", 1, amount, 2),
+            ])
+            self.assertFalse(report.applied, amount)
+            self.assertIn("line 2: invalid amount", report.error)
+        self.assertEqual((self.acc1.balance, self.acc2.balance), (1000, 500))
+
+    def test_missing_account_id_rejects_batch(self):
+        report = self.processor.apply_batch([Transaction("deposit", None, 5)])
+        self.assertEqual(report.error, "line 1: transaction has no account")
+
+    def test_run_splits_into_batches(self):
+        transactions = [Transaction("deposit", 1, 1) for _ in range(7)]
+        reports = self.processor.run(iter(transactions))
+        self.assertEqual([report.size for report in reports], [3, 3, 1])
+        self.assertEqual(self.acc1.balance, 1007)
+
+    def test_read_transactions_streams_csv(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as file:
+            file.write("kind,account_id,amount,target_id\n")
+            file.write("deposit,1,50\n")
+            file.write("transfer,1,25.5,2\n")
+        try:
+            transactions = list(read_transactions(file.name))
+        finally:
+            os.remove(file.name)
+
+        self.assertEqual(transactions[0], Transaction("deposit", 1, 50))
+        self.assertEqual(transactions[1], Transaction("transfer", 1, 25.5, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
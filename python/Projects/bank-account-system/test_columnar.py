@@ -0,0 +1,83 @@
+import unittest
+
+from bank import BankAccount, SavingsAccount
+from columnar import ColumnarAccounts
+
+
+class TestColumnarAccounts(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ColumnarAccounts(capacity=2)
+        self.acc1 = self.store.add(1, "Pius", 1000)
+        self.acc2 = self.store.add(2, "Jane", 500)
+        self.savings = self.store.add(3, "Mark", 1000, 0.05)
+
+    def test_views_behave_like_bank_accounts(self):
+        self.assertEqual(self.acc1.deposit(200), "Deposited 200. New balance: 1200")
+        self.assertEqual(self.acc2.withdraw(200), "Withdrew 200. New balance: 300")
+        self.assertEqual(self.acc1.withdraw(5000), "Insufficient funds")
+        self.assertEqual(self.acc1.get_balance(), "Account balance: 1200")
+        self.assertEqual(self.acc1.transfer(300, self.acc2), "Transferred 300 to Jane's account")
+        self.assertEqual(self.acc1.balance, 900)
+        self.assertEqual(self.acc2.balance, 600)
+
+    def test_store_grows_past_capacity(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store[3].owner_name, "Mark")
+
+    def test_empty_store_can_grow(self):
+        store = ColumnarAccounts(capacity=0)
+        store.extend([1, 2, 3], ["Pius", "Jane", "Mark"], [10, 20, 30])
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store[3].balance, 30)
+        self.assertEqual(ColumnarAccounts.from_accounts([]).balance_report()["accounts"], 0)
+
+    def test_mismatched_lengths_rejected_before_writing(self):
+        with self.assertRaises(ValueError):
+            self.store.extend([10, 11], ["Ten"], [1, 2])
+        with self.assertRaises(ValueError):
+            self.store.extend([10, 11], ["Ten", "Eleven"], [1, 2], [0.05])
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(len(self.store.owner_name), 3)
+        self.assertIsNone(self.store.get(10))
+
+    def test_duplicate_ids_rejected(self):
+        with self.assertRaises(ValueError):
+            self.store.add(1, "Again", 0)
+
+    def test_vectorised_interest_matches_savings_account(self):
+        paid = self.store.apply_interest()
+        self.assertEqual(paid, 5000)
+        self.assertEqual(self.savings.balance, 1050)
+        self.assertEqual(self.acc1.balance, 1000)
+
+    def test_interest_is_exact_in_cents(self):
+        account = self.store.add(4, "Cents", 0.10, 0.05)
+        for _ in range(3):
+            self.store.apply_interest()
+        self.assertEqual(account.balance_cents, 10)  # 0.5 cent rounds to even, never drifts
+
+    def test_fee_sweep_only_below_minimum_and_never_negative(self):
+        poor = self.store.add(4, "Poor", 2)
+        collected = self.store.apply_fee(5, minimum_balance=600)
+        self.assertEqual(collected, 700)
+        self.assertEqual(self.acc2.balance, 495)
+        self.assertEqual(poor.balance, 0)
+        self.assertEqual(self.acc1.balance, 1000)
+
+    def test_balance_report(self):
+        report = self.store.balance_report()
+        self.assertEqual(report["accounts"], 3)
+        self.assertEqual(report["total"], 2500)
+        self.assertEqual(report["max"], 1000)
+
+    def test_from_accounts_imports_objects(self):
+        store = ColumnarAccounts.from_accounts(
+            [BankAccount(10, "Ann", 12.34), SavingsAccount(11, "Ben", 100, 0.1)]
+        )
+        self.assertEqual(store[10].balance_cents, 1234)
+        self.assertEqual(store[11].interest_rate, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
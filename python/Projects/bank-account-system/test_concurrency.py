@@ -0,0 +1,55 @@
+import threading
+import unittest
+
+from bank import BankAccount
+from concurrency import ConcurrentTransferExecutor, stress_test
+
+
+class TestConcurrentTransfers(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.acc1 = BankAccount(1, "Pius", 1000)
+        self.acc2 = BankAccount(2, "Jane", 1000)
+
+    def test_executor_reports_succeeded_and_failed(self):
+        executor = ConcurrentTransferExecutor(workers=4, chunk_size=2)
+        succeeded, failed = executor.run([(1, 2, 600), (1, 2, 600), (2, 1, 100)])
+        self.assertEqual((succeeded, failed), (2, 1))
+        self.assertEqual(self.acc1.balance + self.acc2.balance, 2000)
+
+    def test_unknown_account_fails_transfer(self):
+        executor = ConcurrentTransferExecutor()
+        self.assertFalse(executor.transfer(1, 99, 10))
+        self.assertEqual(self.acc1.balance, 1000)
+
+    def test_mixed_id_types_can_transfer(self):
+        savings = BankAccount("S-1", "Mark", 100)
+        self.assertEqual(savings.transfer(40, self.acc1), "Transferred 40 to Pius's account")
+        self.assertEqual((savings.balance, self.acc1.balance), (60, 1040))
+
+    def test_opposite_transfers_do_not_deadlock(self):
+        def ping(source, target):
+            for _ in range(2_000):
+                source.transfer(1, target)
+
+        threads = [
+            threading.Thread(target=ping, args=(self.acc1, self.acc2)),
+            threading.Thread(target=ping, args=(self.acc2, self.acc1)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual(self.acc1.balance + self.acc2.balance, 2000)
+
+    def test_stress_conserves_money(self):
+        result = stress_test(num_accounts=20, num_transfers=20_000, workers=8, hot_accounts=5)
+        self.assertTrue(result["conserved"])
+        self.assertEqual(result["succeeded"] + result["failed"], 20_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
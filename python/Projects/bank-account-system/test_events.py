@@ -0,0 +1,67 @@
+import unittest
+
+from bank import BankAccount, SavingsAccount
+from batch import BatchProcessor, Transaction
+from events import BalanceEventLog
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class TestBalanceEventLog(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.log = BalanceEventLog(checkpoint_every=4, clock=FakeClock()).attach()
+        self.acc1 = BankAccount(1, "Pius", 1000)   # t=1
+        self.acc2 = BankAccount(2, "Jane", 500)    # t=2
+
+    def tearDown(self):
+        self.log.detach()
+
+    def test_balance_as_of_replays_from_checkpoint(self):
+        for _ in range(10):
+            self.acc1.deposit(10)                  # t=3..12
+        self.assertEqual(self.log.balance_as_of(1, 7), 1050)
+        self.assertEqual(self.log.balance_as_of(1, 12), 1100)
+        self.assertEqual(self.log.balance_as_of(1, 1000), self.acc1.balance)
+        self.assertEqual(len(self.log.histories[1].checkpoints), 3)
+
+    def test_balance_before_open_is_none(self):
+        self.assertIsNone(self.log.balance_as_of(2, 1))
+        self.assertIsNone(self.log.balance_as_of(99, 10))
+
+    def test_transfer_and_failed_operations(self):
+        self.acc1.transfer(300, self.acc2)         # t=3
+        self.acc2.withdraw(5000)                   # declined, not logged
+        self.assertEqual(self.log.balance_as_of(1, 3), 700)
+        self.assertEqual(self.log.balance_as_of(2, 3), 800)
+        self.assertEqual(self.log.events, 4)
+
+    def test_statement_between_times(self):
+        self.acc1.deposit(100)                     # t=3
+        self.acc1.withdraw(50)                     # t=4
+        self.acc1.transfer(25, self.acc2)          # t=5
+        statement = self.log.statement(1, 4, 5)
+        self.assertEqual(statement["opening_balance"], 1100)
+        self.assertEqual(statement["closing_balance"], 1025)
+        self.assertEqual(
+            [(kind, delta) for _, kind, delta, _ in statement["entries"]],
+            [("withdraw", -50), ("transfer_out", -25)],
+        )
+
+    def test_interest_and_batches_are_logged(self):
+        savings = SavingsAccount(3, "Mark", 1000, 0.05)
+        savings.apply_interest()
+        BatchProcessor().apply_batch([Transaction("deposit", 3, 50)])
+        self.assertEqual(self.log.balance_as_of(3, 10_000), 1100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+import journal
+
+from bank import BankAccount, SavingsAccount
+from batch import BatchProcessor, Transaction
+from journal import Journal, recover
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.folder = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.folder, "accounts.journal")
+        self.snapshot_path = os.path.join(self.folder, "accounts.snapshot")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_recover_replays_journal(self):
+        with Journal(self.journal_path):
+            acc1 = BankAccount(1, "Pius", 1000)
+            acc2 = BankAccount(2, "Jane", 500)
+            savings = SavingsAccount(3, "Mark", 1000, 0.05)
+            acc1.deposit(200)
+            acc2.withdraw(100)
+            acc1.transfer(300, savings)
+            savings.apply_interest()
+
+        recovered = recover(self.journal_path)
+        self.assertEqual(recovered[1].balance, 900)
+        self.assertEqual(recovered[2].balance, 400)
+        self.assertEqual(recovered[3].balance, 1365.0)
+        self.assertIsInstance(recovered[3], SavingsAccount)
+        self.assertEqual(recovered[3].interest_rate, 0.05)
+        self.assertEqual(recovered[1].owner_name, "Pius")
+
+    def test_failed_operations_are_not_journaled(self):
+        with Journal(self.journal_path):
+            acc1 = BankAccount(1, "Pius", 100)
+            acc1.withdraw(500)
+
+        self.assertEqual(recover(self.journal_path)[1].balance, 100)
+
+    def test_group_commit_batches_fsyncs(self):
+        with Journal(self.journal_path, group_size=100, group_interval=60) as journal:
+            acc1 = BankAccount(1, "Pius", 0)
+            for _ in range(999):
+                acc1.deposit(1)
+            self.assertEqual(journal.syncs, 10)
+
+        self.assertEqual(recover(self.journal_path)[1].balance, 999)
+
+    def test_flusher_syncs_a_quiet_journal(self):
+        with Journal(self.journal_path, group_size=1_000, group_interval=0.01) as journal:
+            acc1 = BankAccount(1, "Pius", 0)
+            for _ in range(5):
+                acc1.deposit(1)
+            deadline = time.monotonic() + 5
+            while journal.durable < journal.written and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertGreater(journal.syncs, 0)
+            self.assertEqual(recover(self.journal_path)[1].balance, 5)
+
+    def test_wait_durable_covers_the_callers_record(self):
+        with Journal(self.journal_path, group_size=1_000, group_interval=0.05) as journal:
+            acc1 = BankAccount(1, "Pius", 0)
+            acc1.deposit(7)
+            self.assertTrue(journal.wait_durable(timeout=5))
+            self.assertEqual(journal.durable, 2)
+            self.assertEqual(recover(self.journal_path)[1].balance, 7)
+
+    def test_no_group_interval_syncs_only_full_groups(self):
+        with Journal(self.journal_path, group_size=3, group_interval=None) as journal:
+            acc1 = BankAccount(1, "Pius", 0)
+            for _ in range(4):
+                acc1.deposit(1)
+            self.assertEqual(journal.syncs, 1)
+            self.assertEqual(acc1.balance, 4)
+
+        self.assertEqual(recover(self.journal_path)[1].balance, 4)
+
+    def test_checkpoint_includes_account_opened_while_it_starts(self):
+        real_locked = journal.locked
+        late = []
+
+        @contextmanager
+        def open_account_first(*accounts):
+            # An account opens after checkpoint() listed the accounts, before it locks them
+            if not late:
+                late.append(BankAccount(2, "Jane", 500))
+            with real_locked(*accounts):
+                yield
+
+        with Journal(self.journal_path, snapshot_path=self.snapshot_path) as log:
+            acc1 = BankAccount(1, "Pius", 1000)
+            with mock.patch.object(journal, "locked", open_account_first):
+                log.checkpoint()
+            late[0].deposit(50)
+            acc1.deposit(1)
+
+        recovered = recover(self.journal_path, self.snapshot_path)
+        self.assertEqual(recovered[2].balance, 550)
+        self.assertEqual(recovered[1].balance, 1001)
+
+    def test_snapshot_then_replay_tail(self):
+        with Journal(self.journal_path, snapshot_path=self.snapshot_path) as journal:
+            acc1 = BankAccount(1, "Pius", 1000)
+            acc2 = BankAccount(2, "Jane", 500)
+            BatchProcessor().apply_batch([Transaction("transfer", 1, 250, 2)])
+            journal.checkpoint()
+            acc2.deposit(50)
+
+        recovered = recover(self.journal_path, self.snapshot_path)
+        self.assertEqual(recovered[1].balance, 750)
+        self.assertEqual(recovered[2].balance, 800)
+
+    def test_torn_tail_is_ignored(self):
+        with Journal(self.journal_path):
+            acc1 = BankAccount(1, "Pius", 1000)
+            acc1.deposit(1)
+
+        with open(self.journal_path, "ab") as file:
+            file.write(b"\x01\x02\x03")
+
+        self.assertEqual(recover(self.journal_path)[1].balance, 1001)
+        self.assertEqual(recover(self.journal_path)[1].balance, 1001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import gc
+import unittest
+
+from bank import BankAccount, SavingsAccount
+from registry import AccountRegistry
+
+
+class TestAccountRegistry(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.acc1 = BankAccount(1, "Pius", 1000)
+        self.acc2 = BankAccount(2, "Jane", 500)
+        self.savings = SavingsAccount(3, "Pius", 1000, 0.05)
+
+    def test_get_returns_account_by_id(self):
+        self.assertIs(BankAccount.all_accounts.get(2), self.acc2)
+        self.assertIsNone(BankAccount.all_accounts.get(99))
+
+    def test_find_by_owner_uses_secondary_index(self):
+        accounts = BankAccount.all_accounts.find_by_owner("Pius")
+        self.assertEqual(accounts, [self.acc1, self.savings])
+
+    def test_remove_drops_account_and_owner_index(self):
+        removed = BankAccount.all_accounts.remove(1)
+        self.assertIs(removed, self.acc1)
+        self.assertNotIn(1, BankAccount.all_accounts)
+        self.assertEqual(BankAccount.all_accounts.find_by_owner("Pius"), [self.savings])
+
+    def test_reused_id_replaces_old_account(self):
+        replacement = BankAccount(2, "Mark", 0)
+        self.assertIs(BankAccount.all_accounts.get(2), replacement)
+        self.assertEqual(BankAccount.all_accounts.find_by_owner("Jane"), [])
+        self.assertEqual(len(BankAccount.all_accounts), 3)
+
+    def test_unreferenced_accounts_are_released(self):
+        registry = AccountRegistry()
+        registry.add(BankAccount(10, "Temp", 0))
+        gc.collect()
+        self.assertEqual(len(registry), 0)
+        self.assertEqual(registry.find_by_owner("Temp"), [])
+
+    def test_iterates_live_accounts(self):
+        self.assertEqual(list(BankAccount.all_accounts), [self.acc1, self.acc2, self.savings])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from bank import BankAccount
+from loadgen import run_load
+from service import BankService
+
+
+class TestBankService(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.acc1 = BankAccount(1, "Pius", 1000)
+        self.acc2 = BankAccount(2, "Jane", 500)
+        self.service = BankService()
+
+    def test_execute_operations(self):
+        self.assertEqual(self.service.execute({"op": "deposit", "account_id": 1, "amount": 200})["balance"], 1200)
+        self.assertFalse(self.service.execute({"op": "withdraw", "account_id": 2, "amount": 900})["ok"])
+        response = self.service.execute({"op": "transfer", "account_id": 1, "amount": 300, "target_id": 2})
+        self.assertTrue(response["ok"])
+        self.assertEqual(self.acc2.balance, 800)
+        self.assertEqual(self.service.execute({"op": "balance", "account_id": 2})["balance"], 800)
+        self.assertFalse(self.service.execute({"op": "balance", "account_id": 99})["ok"])
+
+    def test_concurrent_requests_share_one_micro_batch(self):
+        async def burst():
+            requests = [{"op": "deposit", "account_id": 1, "amount": 1} for _ in range(25)]
+            return await asyncio.gather(*(self.service.handle(request) for request in requests))
+
+        responses = asyncio.run(burst())
+        self.assertTrue(all(response["ok"] for response in responses))
+        self.assertEqual(self.service.batches, 1)
+        self.assertEqual(self.acc1.balance, 1025)
+
+    def test_batch_applies_requests_in_order(self):
+        events = []
+
+        def observer(event, account, amount, target):
+            events.append((event, amount))
+
+        BankAccount.observers.append(observer)
+        try:
+            responses = self.service.execute_batch([
+                {"op": "withdraw", "account_id": 2, "amount": 600},
+                {"op": "transfer", "account_id": 1, "amount": 200, "target_id": 2},
+                {"op": "withdraw", "account_id": 2, "amount": 600},
+                {"op": "deposit", "account_id": 99, "amount": 5},
+                {"op": "deposit", "account_id": 1},
+                {"op": "deposit", "account_id": 1, "amount": "ten"},
+                {"op": "close", "account_id": 1},
+                {"op": "balance", "account_id": 1},
+            ])
+        finally:
+            BankAccount.observers.remove(observer)
+
+        self.assertEqual(
+            [(response["ok"], response.get("balance")) for response in responses],
+            [(False, 500), (True, 800), (True, 100), (False, None), (False, None), (False, None), (False, None),
+             (True, 800)],
+        )
+        self.assertEqual(responses[0]["message"], "Insufficient funds")
+        self.assertEqual(responses[3]["message"], "Account not found")
+        self.assertTrue(responses[4]["message"].startswith("Bad request"))
+        self.assertEqual(responses[6]["message"], "Unknown operation: close")
+        self.assertEqual(events, [("transfer", 200), ("withdraw", 600)])
+        self.assertEqual((self.acc1.balance, self.acc2.balance), (800, 100))
+
+    def test_invalid_amounts_are_refused(self):
+        requests = [
+            {"op": "transfer", "account_id": 1, "amount": -500, "target_id": 2},
+            {"op": "withdraw", "account_id": 2, "amount": -100},
+            {"op": "deposit", "account_id": 1, "amount": float("nan")},
+            {"op": "deposit", "account_id": 1, "amount": float("inf")},
+            {"op": "deposit", "account_id": 1, "amount": True},
+            {"op": "deposit", "account_id": 1, "amount": 0},
+        ]
+        for response in self.service.execute_batch(requests):
+            self.assertEqual(response, {"ok": False, "message": "Invalid amount"})
+        self.assertEqual((self.acc1.balance, self.acc2.balance), (1000, 500))
+
+    def test_failed_flush_fails_every_waiting_request(self):
+        async def burst():
+            requests = [{"op": "deposit", "account_id": 1, "amount": 1} for _ in range(3)]
+            return await asyncio.gather(*(self.service.handle(request) for request in requests),
+                                        return_exceptions=True)
+
+        with mock.patch.object(self.service, "execute_batch", side_effect=RuntimeError("boom")):
+            results = asyncio.run(asyncio.wait_for(burst(), timeout=5))
+        self.assertEqual([type(result) for result in results], [RuntimeError] * 3)
+
+    def test_round_trip_over_socket(self):
+        async def talk():
+            server = await self.service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"op": "withdraw", "account_id": 2, "amount": 100}\n')
+            writer.write(b"not json\n")
+            writer.write(b"\xff\xfe\n")
+            await writer.drain()
+            first = json.loads(await reader.readline())
+            second = json.loads(await reader.readline())
+            third = json.loads(await reader.readline())
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            return first, second, third
+
+        first, second, third = asyncio.run(talk())
+        self.assertEqual(first, {"ok": True, "balance": 400})
+        self.assertFalse(second["ok"])
+        self.assertEqual(third, {"ok": False, "message": "Invalid JSON"})
+
+    def test_load_generator_reports_latency(self):
+        result = asyncio.run(run_load(clients=5, requests_per_client=20, num_accounts=10))
+        self.assertEqual(result["requests"], 100)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertGreater(result["per_second"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
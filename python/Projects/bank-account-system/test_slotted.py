@@ -0,0 +1,45 @@
+import unittest
+
+from bank import BankAccount
+from slotted import SlottedBankAccount, SlottedSavingsAccount, benchmark
+
+
+class TestSlottedAccounts(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.acc1 = SlottedBankAccount(1, "Pius", 1000)
+        self.acc2 = SlottedBankAccount(2, "Jane", 500)
+        self.savings = SlottedSavingsAccount(3, "Mark", 1000, 0.05)
+
+    def test_same_interface_as_bank_account(self):
+        self.assertEqual(self.acc1.deposit(200), "Deposited 200. New balance: 1200")
+        self.assertEqual(self.acc2.withdraw(200), "Withdrew 200. New balance: 300")
+        self.assertEqual(self.acc1.get_balance(), "Account balance: 1200")
+        self.assertEqual(self.acc1.transfer(300, self.savings), "Transferred 300 to Mark's account")
+        self.assertEqual(self.savings.apply_interest(), "Interest applied. New balance: 1365.0")
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.acc1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.acc1.nickname = "savings"
+
+    def test_registered_like_bank_accounts(self):
+        self.assertIs(BankAccount.all_accounts.get(3), self.savings)
+
+    def test_can_transfer_to_regular_account(self):
+        regular = BankAccount(4, "Ann", 0)
+        self.acc1.transfer(100, regular)
+        self.assertEqual(regular.balance, 100)
+
+    def test_benchmark_reports_every_class(self):
+        results = benchmark(count=1_000)
+        self.assertEqual(
+            set(results),
+            {"BankAccount", "SlottedBankAccount", "SavingsAccount", "SlottedSavingsAccount"},
+        )
+        self.assertTrue(all(size > 0 and rate > 0 for size, rate in results.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import csv
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from bank import BankAccount, SavingsAccount
+from events import BalanceEventLog
+from statements import export_accounts, export_transactions
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class TestStatements(unittest.TestCase):
+
+    def setUp(self):
+        BankAccount.all_accounts.clear()
+        self.folder = tempfile.mkdtemp()
+        self.prefix = os.path.join(self.folder, "statement")
+        self.log = BalanceEventLog(checkpoint_every=2, clock=FakeClock()).attach()
+        self.accounts = [BankAccount(i, f"Owner {i}", 100) for i in range(1, 6)]
+        self.accounts.append(SavingsAccount(6, "Saver", 1000, 0.05))
+        self.accounts[0].deposit(50)                     # t=7
+        self.accounts[0].transfer(30, self.accounts[1])  # t=8
+        self.log.detach()
+
+    def tearDown(self):
+        self.log.detach()
+        shutil.rmtree(self.folder)
+
+    def test_accounts_csv_in_shards(self):
+        parts = export_accounts(self.prefix, shard_size=4, processes=1)
+        self.assertEqual([count for _, count in parts], [4, 2])
+
+        rows = []
+        for path, _ in parts:
+            with open(path, newline="") as file:
+                rows.extend(csv.DictReader(file))
+        self.assertEqual(rows[0], {"account_id": "1", "owner_name": "Owner 1", "balance": "120", "interest_rate": ""})
+        self.assertEqual(rows[-1]["interest_rate"], "0.05")
+
+    def test_gzip_jsonl_with_process_pool(self):
+        parts = export_accounts(self.prefix, fmt="jsonl", compress=True, shard_size=3, processes=2)
+        rows = []
+        for path, _ in parts:
+            self.assertTrue(path.endswith(".jsonl.gz"))
+            with gzip.open(path, "rt") as file:
+                rows.extend(json.loads(line) for line in file)
+        self.assertEqual([row["account_id"] for row in rows], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(rows[1]["balance"], 130)
+
+    def test_transactions_between_times(self):
+        parts = export_transactions(self.prefix, self.log, start=7, end=8, fmt="jsonl", processes=1)
+        with open(parts[0][0]) as file:
+            rows = [json.loads(line) for line in file]
+        self.assertEqual(
+            [(row["account_id"], row["kind"], row["amount"], row["balance"]) for row in rows],
+            [(1, "deposit", 50, 150), (1, "transfer_out", -30, 120), (2, "transfer_in", 30, 130)],
+        )
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export_accounts(self.prefix, fmt="xml", processes=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
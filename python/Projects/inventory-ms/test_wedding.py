@@ -1,5 +1,8 @@
+import json
+import os
+import tempfile
 import unittest
-from wedding import Wedding, Invitation, Guest, SpecialGuest
+from wedding import Wedding, Invitation, Guest, SpecialGuest, read_guest_records
 
 
 class TestWedding(unittest.TestCase):
@@ -43,6 +46,45 @@ class TestWedding(unittest.TestCase):
         guest = self.wedding.get_guest_by_email("nobody@email.com")
         self.assertIsNone(guest)
 
+    def test_invitation_list_keeps_sending_order(self):
+        self.wedding.send_invitation("Mark", "mark@email.com")
+        emails = [invitation.guest.email for invitation in self.wedding.invitation_list]
+        self.assertEqual(emails, ["Jane@email.com", "John@email.com", "mark@email.com"])
+
+    def test_guest_lists_are_read_only_views(self):
+        invitations = self.wedding.invitation_list
+        confirmed = self.wedding.confirmed_guest_list
+        with self.assertRaises(AttributeError):
+            invitations.append(Invitation(self.john))
+        with self.assertRaises(TypeError):
+            del confirmed[0]
+
+        # Views follow later changes, and lookups work by identity
+        self.john.accept_invitation()
+        self.assertEqual(list(confirmed), [self.john])
+        self.assertIn(self.john, confirmed)
+        self.assertNotIn(self.jane, confirmed)
+        self.assertNotIn("John@email.com", confirmed)
+        self.assertIn(self.wedding.retrieve_invitation("Jane@email.com"), invitations)
+        self.assertNotIn(Invitation(self.jane), invitations)
+        self.assertEqual(invitations[-1].guest, self.john)
+        self.assertEqual([invitation.guest for invitation in invitations[:1]], [self.jane])
+
+    def test_invitation_count_and_is_invited(self):
+        self.assertEqual(self.wedding.invitation_count, 2)
+        self.assertTrue(self.wedding.is_invited("Jane@email.com"))
+        self.assertFalse(self.wedding.is_invited("nobody@email.com"))
+        self.wedding.remove_invitation("Jane@email.com")
+        self.assertEqual(self.wedding.invitation_count, 1)
+        self.assertFalse(self.wedding.is_invited("Jane@email.com"))
+
+    def test_confirmed_guest_list_keeps_confirmation_order(self):
+        self.john.accept_invitation()
+        self.jane.accept_invitation()
+        self.john.accept_invitation()
+        self.assertEqual(list(self.wedding.confirmed_guest_list), [self.john, self.jane])
+        self.assertTrue(self.wedding.is_confirmed(self.jane))
+
 
 class TestInvitation(unittest.TestCase):
 
@@ -134,5 +176,126 @@ class TestSpecialGuest(unittest.TestCase):
         self.assertNotIn(mark, self.wedding.confirmed_guest_list)
 
 
+class TestImportGuests(unittest.TestCase):
+
+    def setUp(self):
+        self.wedding = Wedding("Alice", "Bob")
+        self.wedding.send_invitation("John", "John@email.com")
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.folder.name, name)
+        with open(path, "w", newline="") as file:
+            file.write(text)
+        return path
+
+    def test_import_csv_with_plus_ones(self):
+        path = self.write("guests.csv", (
+            "name,email,is_special,plus_one_of\n"
+            "Mark,mark@email.com,,Jane@email.com\n"  # plus-one listed before their host
+            "Jane,Jane@email.com,true,\n"
+            "Sam,sam@email.com,,Jane@email.com\n"  # Jane already has a plus one
+            "Eve,eve@email.com,,John@email.com\n"  # John is not a special guest
+            "John Again,John@email.com,,\n"
+            "Jane Again,Jane@email.com,,\n"
+        ))
+        summary = self.wedding.import_guests(read_guest_records(path), batch_size=1)
+
+        self.assertEqual(summary["invited"], 2)
+        self.assertEqual(summary["plus_ones"], 1)
+        self.assertEqual(summary["duplicates"], 2)
+        self.assertEqual([email for email, _ in summary["rejected"]], ["sam@email.com", "eve@email.com"])
+
+        jane = self.wedding.get_guest_by_email("Jane@email.com")
+        self.assertIsInstance(jane, SpecialGuest)
+        self.assertEqual(jane.plus_one.email, "mark@email.com")
+        self.assertEqual(jane.plus_one.inviting_guest_email, "Jane@email.com")
+        self.assertIs(self.wedding.get_guest_by_email("mark@email.com"), jane.plus_one)
+        self.assertEqual(len(self.wedding.invitation_list), 3)  # John, Jane, Mark
+
+    def test_import_rejects_records_without_name_or_email(self):
+        summary = self.wedding.import_guests([
+            {"name": "Ann"},
+            {"email": "bob@email.com"},
+            {"name": "Cat", "email": ""},
+            {"name": "Dan", "email": "dan@email.com"},
+        ])
+
+        self.assertEqual(summary["invited"], 1)
+        self.assertEqual([email for email, _ in summary["rejected"]], [None, "bob@email.com", None])
+        self.assertTrue(self.wedding.is_invited("dan@email.com"))
+        self.assertFalse(self.wedding.is_invited("bob@email.com"))
+
+    def test_import_jsonl_and_uninvite(self):
+        records = [
+            {"name": "Jane", "email": "jane@email.com", "is_special": True},
+            {"name": "Mark", "email": "mark@email.com", "plus_one_of": "jane@email.com"},
+            {"name": "Ann", "email": "ann@email.com"},
+        ]
+        path = self.write("guests.jsonl", "\n".join(json.dumps(record) for record in records) + "\n")
+        self.wedding.import_guests(read_guest_records(path))
+
+        jane = self.wedding.get_guest_by_email("jane@email.com")
+        self.assertIsInstance(self.wedding.get_guest_by_email("ann@email.com"), Guest)
+        jane.uninvite_plus_one()
+        self.assertIsNone(self.wedding.retrieve_invitation("mark@email.com"))
+        jane.invite_plus_one("Sam", "sam@email.com")
+        self.assertEqual(jane.plus_one.email, "sam@email.com")
+
+
+class TestRsvpCounters(unittest.TestCase):
+
+    def setUp(self):
+        self.wedding = Wedding("Alice", "Bob")
+        self.wedding.send_invitation("Jane", "Jane@email.com", is_special=True)
+        self.wedding.send_invitation("John", "John@email.com")
+        self.jane = self.wedding.get_guest_by_email("Jane@email.com")
+        self.john = self.wedding.get_guest_by_email("John@email.com")
+        self.events = []
+        self.wedding.subscribe(lambda event, guest, counts: self.events.append((event, guest and guest.email, counts)))
+
+    def test_counts_follow_rsvps(self):
+        self.jane.invite_plus_one("Mark", "mark@email.com")
+        mark = self.wedding.get_guest_by_email("mark@email.com")
+        mark.accept_invitation()
+        self.john.accept_invitation()
+        self.john.decline_invitation()
+        self.assertEqual(
+            self.wedding.counts,
+            {"pending": 1, "accepted": 1, "declined": 1, "confirmed_plus_ones": 1, "confirmed": 1},
+        )
+
+        self.jane.uninvite_plus_one()
+        self.assertEqual(
+            self.wedding.counts,
+            {"pending": 1, "accepted": 0, "declined": 1, "confirmed_plus_ones": 0, "confirmed": 0},
+        )
+
+    def test_invitation_accept_called_directly_is_counted(self):
+        self.wedding.retrieve_invitation("John@email.com").accept()
+        self.wedding.retrieve_invitation("John@email.com").accept()
+        self.assertEqual(self.wedding.counts["accepted"], 1)
+        self.assertEqual(self.wedding.counts["pending"], 1)
+
+    def test_subscribers_get_events_with_counts(self):
+        self.john.accept_invitation()
+        self.assertEqual([(event, email) for event, email, _ in self.events],
+                         [("accepted", "John@email.com"), ("confirmed", "John@email.com")])
+        self.assertEqual(self.events[-1][2]["confirmed"], 1)
+
+        self.wedding.import_guests([{"name": "Ann", "email": "ann@email.com"}])
+        self.assertEqual(self.events[-1][0], "imported")
+        self.assertEqual(self.events[-1][2]["pending"], 2)
+
+    def test_unsubscribe(self):
+        callback = self.wedding._subscribers[0]
+        self.wedding.unsubscribe(callback)
+        self.john.accept_invitation()
+        self.assertEqual(self.events, [])
+
+
 if __name__ == "__main__":
     unittest.main()
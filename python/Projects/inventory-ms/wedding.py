@@ -1,4 +1,9 @@
-from typing import List, Optional
+import csv
+import json
+import time
+from collections import abc
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
 
 class Invitation:
@@ -10,24 +15,118 @@ class Invitation:
         return f"Invitation for {self.guest.name} - status: {self.status}"
 
     def accept(self) -> None:
-        self.status = "accepted"
+        self._set_status("accepted")
 
     def decline(self) -> None:
-        self.status = "declined"
+        self._set_status("declined")
+
+    def _set_status(self, status: str) -> None:
+        old_status, self.status = self.status, status
+        if old_status != status:
+            self.guest.wedding._status_changed(self, old_status)
+
+
+class _DictValues(abc.Sequence):
+    # A read-only, live view of a dict's values (in insertion order) that copies nothing.
+    # key_of turns a value back into its dict key, so `in` is a dict lookup instead of a scan.
+    # There is no append/remove, so code that tries to change the list fails loudly.
+    __slots__ = ("_items", "_key_of")
+
+    def __init__(self, items: Dict[str, Any], key_of: Callable[[Any], str]) -> None:
+        self._items = items
+        self._key_of = key_of
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items.values())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._items.values())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._items.values())[index]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("index out of range")
+        return next(islice(self._items.values(), index, None))
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            key = self._key_of(value)
+        except AttributeError:
+            return False
+        return self._items.get(key) is value
+
+    def __repr__(self) -> str:
+        return repr(list(self._items.values()))
 
 
 class Wedding:
     def __init__(self, bride_name: str, groom_name: str) -> None:
         self.bride_name = bride_name
         self.groom_name = groom_name
-        self.confirmed_guest_list: List["Guest"] = []
-        self.invitation_list: List["Invitation"] = []
-        
+        # Both are dicts keyed by email: lookups, adds and removes are O(1), and dicts keep
+        # insertion order, so the confirmed guests still come out in the order they confirmed
+        self._invitations: Dict[str, "Invitation"] = {}
+        self._confirmed: Dict[str, "Guest"] = {}
+        # Running RSVP counts, changed by one on every status change, so reading them never loops
+        # over the invitations. Subscribers are called as callback(event, guest, counts).
+        self._counts = {"pending": 0, "accepted": 0, "declined": 0, "confirmed_plus_ones": 0}
+        self._subscribers: List[Callable[[str, Optional["Guest"], Dict[str, int]], None]] = []
+
     def __str__(self) -> str:
         return f"{self.bride_name} & {self.groom_name}'s Wedding."
-    
+
+    @property
+    def invitation_list(self) -> Sequence["Invitation"]:
+        # A read-only view, in the order invitations were sent. It follows later changes;
+        # use send_invitation / remove_invitation to change it.
+        return _DictValues(self._invitations, lambda invitation: invitation.guest.email)
+
+    @property
+    def confirmed_guest_list(self) -> Sequence["Guest"]:
+        # A read-only view, in the order guests confirmed; use confirm / unconfirm to change it
+        return _DictValues(self._confirmed, lambda guest: guest.email)
+
+    @property
+    def invitation_count(self) -> int:
+        return len(self._invitations)
+
+    def is_invited(self, email: str) -> bool:
+        return email in self._invitations
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        # pending / accepted / declined invitations, confirmed guests and confirmed plus-ones
+        return {**self._counts, "confirmed": len(self._confirmed)}
+
+    def subscribe(self, callback: Callable[[str, Optional["Guest"], Dict[str, int]], None]) -> None:
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, Optional["Guest"], Dict[str, int]], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _publish(self, event: str, guest: Optional["Guest"]) -> None:
+        if self._subscribers:
+            counts = self.counts
+            for callback in list(self._subscribers):
+                callback(event, guest, counts)
+
+    def _status_changed(self, invitation: "Invitation", old_status: str) -> None:
+        # Only invitations that belong to this wedding are counted
+        if self._invitations.get(invitation.guest.email) is not invitation:
+            return
+        self._counts[old_status] -= 1
+        self._counts[invitation.status] += 1
+        self._publish(invitation.status, invitation.guest)
+
     def send_invitation(self, name: str, email: str, is_special: bool = False) -> None:
-        if self.get_guest_by_email(email):
+        if email in self._invitations:
             return
         if is_special:
             guest = SpecialGuest(name, email, self)
@@ -35,20 +134,104 @@ class Wedding:
             guest = Guest(name, email, self)
 
         invitation = Invitation(guest)
-        self.invitation_list.append(invitation)
+        self._invitations[email] = invitation
+        self._counts[invitation.status] += 1
+        self._publish("invited", guest)
 
     def retrieve_invitation(self, email: str) -> Optional["Invitation"]:
-        for invitation in self.invitation_list:
-            if invitation.guest.email == email:  # clarify
-                return invitation
-        return None
+        return self._invitations.get(email)
 
     def get_guest_by_email(self, email: str) -> Optional["Guest"]:
-        for invitation in self.invitation_list:
-            if invitation.guest.email == email:
-                return invitation.guest
+        invitation = self._invitations.get(email)
+        return invitation.guest if invitation else None
+
+    def remove_invitation(self, email: str) -> Optional["Invitation"]:
+        invitation = self._invitations.get(email)
+        if invitation is None:
+            return None
+
+        self.unconfirm(invitation.guest)
+        del self._invitations[email]
+        self._counts[invitation.status] -= 1
+        self._publish("uninvited", invitation.guest)
+        return invitation
+
+    def confirm(self, guest: "Guest") -> None:
+        if guest.email in self._confirmed:
+            return
+        self._confirmed[guest.email] = guest
+        if guest.inviting_guest_email:
+            self._counts["confirmed_plus_ones"] += 1
+        self._publish("confirmed", guest)
 
-        return None
+    def unconfirm(self, guest: "Guest") -> None:
+        if self._confirmed.pop(guest.email, None) is None:
+            return
+        if guest.inviting_guest_email:
+            self._counts["confirmed_plus_ones"] -= 1
+        self._publish("unconfirmed", guest)
+
+    def is_confirmed(self, guest: "Guest") -> bool:
+        return self._confirmed.get(guest.email) is guest
+
+    def import_guests(self, records: Iterable[Dict[str, Any]], batch_size: int = 10_000) -> Dict[str, Any]:
+        # Bulk version of send_invitation + invite_plus_one, for records like
+        #   {"name": "Jane", "email": "jane@email.com", "is_special": True}
+        #   {"name": "Mark", "email": "mark@email.com", "plus_one_of": "jane@email.com"}
+        # One pass over the records: the first record for an email wins, later ones count as
+        # duplicates. Plus-ones are held back and linked at the end, so a host may appear after
+        # their plus-one in the file. Records without a name or email are rejected, like plus-ones
+        # that cannot be linked. Nothing is printed, and every check is a dict lookup.
+        summary: Dict[str, Any] = {"invited": 0, "plus_ones": 0, "duplicates": 0, "rejected": []}
+        seen = set()
+        plus_ones = []
+        batch: Dict[str, Invitation] = {}
+
+        for record in records:
+            email = record.get("email")
+            if not email or not record.get("name"):
+                summary["rejected"].append((email or None, "record needs a name and an email"))
+                continue
+            if email in seen or email in self._invitations:
+                summary["duplicates"] += 1
+                continue
+            seen.add(email)
+
+            if record.get("plus_one_of"):
+                plus_ones.append(record)
+                continue
+
+            guest_class = SpecialGuest if _is_true(record.get("is_special")) else Guest
+            batch[email] = Invitation(guest_class(record["name"], email, self))
+            if len(batch) >= batch_size:
+                self._add_batch(batch, summary)
+                batch = {}
+
+        self._add_batch(batch, summary)
+
+        # Same rules as invite_plus_one: the host must be a special guest without a plus-one yet
+        batch = {}
+        for record in plus_ones:
+            host_invitation = self._invitations.get(record["plus_one_of"])
+            host = host_invitation.guest if host_invitation else None
+            if not isinstance(host, SpecialGuest):
+                summary["rejected"].append((record["email"], "host is not an invited special guest"))
+            elif host.plus_one:
+                summary["rejected"].append((record["email"], "host already has a plus one"))
+            else:
+                host.plus_one = Guest(record["name"], record["email"], self, inviting_guest_email=host.email)
+                batch[record["email"]] = Invitation(host.plus_one)
+                summary["plus_ones"] += 1
+        self._add_batch(batch, summary)
+
+        # One event for the whole import rather than one per guest
+        self._publish("imported", None)
+        return summary
+
+    def _add_batch(self, batch: Dict[str, "Invitation"], summary: Dict[str, Any]) -> None:
+        self._invitations.update(batch)
+        self._counts["pending"] += len(batch)
+        summary["invited"] += len(batch)
 
 
 class Guest:
@@ -71,15 +254,13 @@ class Guest:
         invitation = self.wedding.retrieve_invitation(self.email)
         if invitation:
             invitation.accept()
-            if self not in self.wedding.confirmed_guest_list:
-                self.wedding.confirmed_guest_list.append(self)
+            self.wedding.confirm(self)
 
     def decline_invitation(self) -> None:
         invitation = self.wedding.retrieve_invitation(self.email)
         if invitation:
             invitation.decline()
-            if self in self.wedding.confirmed_guest_list:
-                self.wedding.confirmed_guest_list.remove(self)
+            self.wedding.unconfirm(self)
 
 
 class SpecialGuest(Guest):
@@ -97,37 +278,99 @@ class SpecialGuest(Guest):
 
         if not self.wedding.get_guest_by_email(email):
             self.wedding.send_invitation(name, email)
-            invitation = self.wedding.retrieve_invitation(email)
-            self.plus_one = invitation.guest
+            self.plus_one = self.wedding.get_guest_by_email(email)
             self.plus_one.inviting_guest_email = self.email
             print(f"Plus one invitation sent to {email}")
 
     def uninvite_plus_one(self) -> None:
         if self.plus_one:
-            invitation = self.wedding.retrieve_invitation(self.plus_one.email)
-            self.wedding.invitation_list.remove(invitation)
-
-            if self.plus_one in self.wedding.confirmed_guest_list:
-                self.wedding.confirmed_guest_list.remove(self.plus_one)
+            # Also drops them from the confirmed guests
+            self.wedding.remove_invitation(self.plus_one.email)
 
             self.plus_one = None
             print(f"{self.name} has been uninvited to {self.wedding}")
 
 
-# if __name__ == "__main__":
-#     # 1. Create the wedding
-#     wedding = Wedding("Alice", "Bob")
+def _is_true(value: Any) -> bool:
+    # CSV gives strings, JSON gives booleans
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return bool(value)
+
+
+def read_guest_records(path: str) -> Iterator[Dict[str, Any]]:
+    # Streams guest records from a .csv (with a header row) or a .jsonl file (one object per line)
+    with open(path, newline="", encoding="utf-8") as file:
+        if path.endswith(".jsonl"):
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(file)
+
+
+def benchmark(count: int = 100_000) -> Dict[str, float]:
+    # Seconds to invite `count` guests (each invite checks for duplicates), look every one up,
+    # then have them all accept and half of them decline again
+    wedding = Wedding("Alice", "Bob")
+    emails = [f"guest{i}@email.com" for i in range(count)]
+    timings = {}
+
+    start = time.perf_counter()
+    for i, email in enumerate(emails):
+        wedding.send_invitation(f"Guest {i}", email, is_special=i % 10 == 0)
+    timings["invite"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    guests = [wedding.get_guest_by_email(email) for email in emails]
+    timings["lookup"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for guest in guests:
+        guest.accept_invitation()
+    for guest in guests[::2]:
+        guest.decline_invitation()
+    timings["rsvp"] = time.perf_counter() - start
+    return timings
+
+
+def benchmark_import(count: int = 100_000) -> float:
+    # Seconds to bulk import `count` guests, a tenth of them special guests each bringing a plus-one
+    records = []
+    for i in range(0, count, 2):
+        host_email = f"guest{i}@email.com"
+        if i % 20 == 0:
+            records.append({"name": f"Guest {i}", "email": host_email, "is_special": True})
+            records.append({"name": f"Plus one {i}", "email": f"plus{i}@email.com", "plus_one_of": host_email})
+        else:
+            records.append({"name": f"Guest {i}", "email": host_email})
+            records.append({"name": f"Guest {i + 1}", "email": f"guest{i + 1}@email.com"})
+
+    wedding = Wedding("Alice", "Bob")
+    start = time.perf_counter()
+    wedding.import_guests(records)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    # 1. Create the wedding
+    wedding = Wedding("Alice", "Bob")
+
+    # 2. Invite a special guest
+    wedding.send_invitation("Jane", "jane@email.com", is_special=True)
 
-#     # 2. Invite a special guest
-#     wedding.send_invitation("Jane", "jane@email.com", is_special=True)
+    # 3. Jane invites a plus one
+    jane = wedding.get_guest_by_email("jane@email.com")
+    jane.invite_plus_one("Mark", "mark@email.com")
 
-#     # 3. Jane invites a plus one
-#     jane = wedding.get_guest_by_email("jane@email.com")
-#     jane.invite_plus_one("Mark", "mark@email.com")
+    # 4. Mark accepts
+    mark = wedding.get_guest_by_email("mark@email.com")
+    mark.accept_invitation()
 
-#     # 4. Mark accepts
-#     mark = wedding.get_guest_by_email("mark@email.com")
-#     mark.accept_invitation()
+    # 5. Jane uninvites Mark
+    jane.uninvite_plus_one()
 
-#     # 5. Jane uninvites Mark
-#     jane.uninvite_plus_one()
+    # 6. How long the same operations take for a big guest list
+    for step, seconds in benchmark().items():
+        print(f"{step:>6}: {seconds:.3f}s for 100,000 guests")
+    print(f"import: {benchmark_import():.3f}s for 100,000 guests")